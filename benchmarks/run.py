@@ -0,0 +1,432 @@
+"""
+Benchmarks for tplot.
+
+Measures the time and peak memory (with `tracemalloc`) of drawing each plot type on fixed synthetic datasets,
+at several data sizes and canvas sizes, in unicode and ascii mode.
+Startup benchmarks measure `import tplot` (in a fresh interpreter) and creating a `Figure`, against a target time.
+
+Usage:
+
+    python benchmarks/run.py run -o results.json
+    python benchmarks/run.py run -o results.json --max-size 10000000 --filter line
+    python benchmarks/run.py compare before.json after.json
+
+`compare` prints the change of each benchmark between two runs and exits with status 1 if any got slower
+or used more memory than the threshold allows, or missed its target.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+# benchmark the tplot in this checkout, rather than a copy installed in site-packages
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import tplot  # noqa: E402
+from tplot.utils import _optimize_xticklabel_anchors  # noqa: E402
+
+SIZES = (10**3, 10**4, 10**5, 10**6, 10**7)
+CANVASES = ((80, 24), (240, 70))
+SEED = 0
+
+
+def _xy(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(SEED)
+    x = np.arange(n, dtype=float)
+    y = np.cumsum(rng.normal(size=n))
+    return x, y
+
+
+def _figure(width: int, height: int, ascii: bool) -> tplot.Figure:
+    return tplot.Figure(
+        xlabel="x",
+        ylabel="y",
+        title="benchmark",
+        width=width,
+        height=height,
+        ascii=ascii,
+    )
+
+
+def setup_scatter(n, width, height, ascii):
+    x, y = _xy(n)
+
+    def run():
+        fig = _figure(width, height, ascii)
+        fig.scatter(x, y)
+        return str(fig)
+
+    return run
+
+
+def setup_line(n, width, height, ascii):
+    x, y = _xy(n)
+
+    def run():
+        fig = _figure(width, height, ascii)
+        fig.line(x, y)
+        return str(fig)
+
+    return run
+
+
+def setup_bar(n, width, height, ascii):
+    x, y = _xy(n)
+
+    def run():
+        fig = _figure(width, height, ascii)
+        fig.bar(x, y)
+        return str(fig)
+
+    return run
+
+
+def setup_hbar(n, width, height, ascii):
+    x, y = _xy(n)
+
+    def run():
+        fig = _figure(width, height, ascii)
+        fig.hbar(y, x)
+        return str(fig)
+
+    return run
+
+
+def setup_hist(n, width, height, ascii):
+    _, y = _xy(n)
+
+    def run():
+        fig = _figure(width, height, ascii)
+        fig.hist(y)
+        return str(fig)
+
+    return run
+
+
+def setup_density(n, width, height, ascii):
+    x, y = _xy(n)
+
+    def run():
+        fig = _figure(width, height, ascii)
+        fig.density(x, y)
+        return str(fig)
+
+    return run
+
+
+def setup_image(n, width, height, ascii):
+    # square image of about `n` pixels
+    side = int(np.sqrt(n))
+    image = np.random.default_rng(SEED).random((side, side))
+
+    def run():
+        fig = _figure(width, height, ascii)
+        fig.image(image)
+        return str(fig)
+
+    return run
+
+
+def setup_text(n, width, height, ascii):
+    # `n` text labels
+    x, y = _xy(n)
+    labels = [f"p{i}" for i in range(n)]
+
+    def run():
+        fig = _figure(width, height, ascii)
+        for args in zip(x.tolist(), y.tolist(), labels):
+            fig.text(*args)
+        return str(fig)
+
+    return run
+
+
+def setup_xticklabels(n, width, height, ascii):
+    # `n` tick labels to place along the x axis
+    positions = np.sort(np.random.default_rng(SEED).uniform(0, width, size=n))
+    labels = [f"{p:.3g}" for p in positions]
+
+    def run():
+        return _optimize_xticklabel_anchors(positions.tolist(), labels, width)
+
+    return run
+
+
+# benchmark name: (setup function, largest size that is worth running)
+BENCHMARKS: Dict[str, Tuple[Callable, int]] = {
+    "scatter": (setup_scatter, 10**7),
+    "line": (setup_line, 10**7),
+    "bar": (setup_bar, 10**7),
+    "hbar": (setup_hbar, 10**7),
+    "hist": (setup_hist, 10**7),
+    "density": (setup_density, 10**7),
+    "image": (setup_image, 10**7),
+    "text": (setup_text, 10**4),
+    "xticklabels": (setup_xticklabels, 10**4),
+}
+
+
+# startup benchmarks: name: (setup, statement timed, timed in a fresh interpreter, target seconds or None)
+STARTUP: Dict[str, Tuple[str, str, bool, Optional[float]]] = {
+    "import": ("", "import tplot", True, 0.01),
+    # includes importing NumPy, which takes most of the time
+    "first_figure": ("", "import tplot; tplot.Figure()", True, None),
+    "construct": ("import tplot; tplot.Figure()", "tplot.Figure()", False, 10e-6),
+    "construct_sized": (
+        "import tplot; tplot.Figure()",
+        "tplot.Figure(width=80, height=24)",
+        False,
+        10e-6,
+    ),
+}
+
+_FRESH_INTERPRETER = """
+import sys, time, tracemalloc
+if sys.argv[1] == "memory":
+    tracemalloc.start()
+start = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - start
+print(seconds, tracemalloc.get_traced_memory()[1])
+"""
+
+
+def measure_startup(name: str, repeat: int) -> dict:
+    """Times a startup benchmark (at least `repeat` times), then measures its peak memory in one more run."""
+    setup, statement, fresh, target = STARTUP[name]
+    if fresh:
+
+        def run(mode: str) -> Tuple[float, int]:
+            script = _FRESH_INTERPRETER.format(statement=statement)
+            # `python -c` imports from the working directory first
+            out = subprocess.run(
+                [sys.executable, "-c", script, mode],
+                cwd=ROOT,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.split()
+            return float(out[0]), int(out[1])
+
+        times = [run("time")[0] for _ in range(max(repeat, 10))]
+        peak = run("memory")[1]
+    else:
+        namespace: dict = {}
+        exec(setup, namespace)
+        timer = timeit.Timer(statement, globals=namespace)
+        number, _ = timer.autorange()
+        times = [t / number for t in timer.repeat(repeat=max(repeat, 5), number=number)]
+        tracemalloc.start()
+        try:
+            exec(statement, namespace)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "name": name,
+        "key": f"startup[{name}]",
+        "runs": len(times),
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_bytes": peak,
+        "target_s": target,
+    }
+
+
+def missed_target(result: dict) -> bool:
+    target = result.get("target_s")
+    return target is not None and result["min_s"] > target
+
+
+def cases(
+    names: List[str], max_size: int, unicode_only: bool = False
+) -> Iterator[dict]:
+    for name in names:
+        limit = BENCHMARKS[name][1]
+        for n in SIZES:
+            if n > min(max_size, limit):
+                continue
+            for width, height in CANVASES:
+                for ascii in (False,) if unicode_only else (False, True):
+                    yield dict(name=name, n=n, width=width, height=height, ascii=ascii)
+
+
+def case_key(case: dict) -> str:
+    mode = "ascii" if case["ascii"] else "unicode"
+    return f"{case['name']}[n={case['n']},{case['width']}x{case['height']},{mode}]"
+
+
+def measure(case: dict, repeat: int, min_time: float) -> dict:
+    """Times `case` (at least `repeat` times and `min_time` seconds), then measures its peak memory in one more run."""
+    setup = BENCHMARKS[case["name"]][0]
+    run = setup(case["n"], case["width"], case["height"], case["ascii"])
+    run()  # warm up caches and imports
+
+    times = []
+    start = time.perf_counter()
+    while len(times) < repeat or time.perf_counter() - start < min_time:
+        t0 = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - t0)
+
+    # tracemalloc slows everything down, so memory is measured separately from time
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        **case,
+        "key": case_key(case),
+        "runs": len(times),
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "peak_bytes": peak,
+    }
+
+
+def _version() -> Optional[str]:
+    try:
+        return tplot.__version__
+    except ImportError:  # not installed, so there is no package metadata
+        return None
+
+
+def metadata() -> dict:
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "tplot": _version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+
+
+def run_benchmarks(args) -> None:
+    def selected(names):
+        return [name for name in names if not args.filter or args.filter in name]
+
+    results = []
+
+    def report(result):
+        results.append(result)
+        target = "MISSED TARGET" if missed_target(result) else ""
+        print(
+            f"{result['key']:<50} {result['min_s'] * 1e3:10.3f} ms "
+            f"{result['peak_bytes'] / 2**20:10.2f} MiB  {target}",
+            flush=True,
+        )
+
+    for name in selected(STARTUP):
+        report(measure_startup(name, args.repeat))
+    for case in cases(selected(BENCHMARKS), args.max_size, args.unicode_only):
+        report(measure(case, args.repeat, args.min_time))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"metadata": metadata(), "results": results}, f, indent=1)
+
+
+def compare(args) -> int:
+    with open(args.before) as f:
+        before = {r["key"]: r for r in json.load(f)["results"]}
+    with open(args.after) as f:
+        after = {r["key"]: r for r in json.load(f)["results"]}
+
+    regressions = 0
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        time_ratio = new["min_s"] / old["min_s"]
+        memory_ratio = (new["peak_bytes"] + 1) / (old["peak_bytes"] + 1)
+        # small absolute differences are noise, not regressions
+        slower = (
+            time_ratio > 1 + args.threshold
+            and new["min_s"] - old["min_s"] > args.min_delta
+        )
+        bigger = memory_ratio > 1 + args.threshold
+        flag = "REGRESSION" if slower or bigger else ""
+        if missed_target(new):
+            flag = f"{flag} MISSED TARGET".strip()
+        regressions += bool(flag)
+        print(f"{key:<50} time {time_ratio:6.2f}x  memory {memory_ratio:6.2f}x  {flag}")
+    for key in sorted(before.keys() - after.keys()):
+        print(f"{key:<50} only in {args.before}")
+    for key in sorted(after.keys() - before.keys()):
+        print(f"{key:<50} only in {args.after}")
+    print(f"{regressions} regression(s)")
+    return 1 if regressions else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run benchmarks")
+    run_parser.add_argument("-o", "--output", help="JSON file to save results to")
+    run_parser.add_argument(
+        "--filter", help="only run benchmarks with this in their name"
+    )
+    run_parser.add_argument(
+        "--max-size",
+        type=int,
+        default=10**6,
+        help="largest number of data points (default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="minimum number of timed runs (default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="minimum total seconds of timed runs (default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "--unicode-only", action="store_true", help="skip ascii mode"
+    )
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="compare two saved runs and flag regressions"
+    )
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative increase in time or memory that counts as a regression (default: %(default)s)",
+    )
+    compare_parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=1e-4,
+        help="ignore time differences below this many seconds (default: %(default)s)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        run_benchmarks(args)
+        return 0
+    return compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
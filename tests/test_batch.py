@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+import tplot
+from tplot import batch
+
+
+def make_specs():
+    rng = np.random.default_rng(0)
+    for i in range(6):
+        y = np.cumsum(rng.normal(size=1000))
+        yield {
+            "title": f"host-{i}",
+            "width": 60,
+            "height": 15,
+            "plots": [
+                {"kind": "line", "y": y, "label": "cpu"},
+                {"kind": "scatter", "x": [0, 500], "y": [0, 10], "color": "red"},
+            ],
+        }
+
+
+def expected():
+    figures = []
+    for spec in make_specs():
+        plots = spec.pop("plots")
+        fig = tplot.Figure(**spec)
+        for plot in plots:
+            getattr(fig, plot.pop("kind"))(**plot)
+        figures.append(str(fig))
+    return figures
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_many(workers, monkeypatch):
+    monkeypatch.setattr(batch, "SHARED_MEMORY_THRESHOLD", 1000)  # use shared memory
+    assert list(tplot.render_many(make_specs(), workers=workers)) == expected()
+
+
+def test_render_to_files(tmp_path):
+    specs = list(make_specs())
+    for i, spec in enumerate(specs):
+        spec["file"] = tmp_path / f"{i}.txt"
+    assert list(tplot.render_many(specs, workers=2)) == [None] * len(specs)
+    for i, figure in enumerate(expected()):
+        assert (tmp_path / f"{i}.txt").read_text(encoding="utf-8") == figure + "\n"
+
+
+def test_unsupported_plot_kind():
+    with pytest.raises(ValueError):
+        list(tplot.render_many([{"plots": [{"kind": "pie", "x": [1]}]}], workers=2))
@@ -1,8 +1,11 @@
+import numpy as np
 import pytest
 
 from tplot.braille import (
     braille_bin,
+    braille_dot_positions,
     braille_from_xy,
+    braille_mask,
     combine_braille,
     draw_braille,
     get_braille,
@@ -54,3 +57,17 @@ def test_draw_braille():
     assert draw_braille(x=0.5, y=0.5, canvas_str=" ") == "⡀"
     assert draw_braille(x=0, y=0, canvas_str=" ") == "⠐"
     assert draw_braille(x=-0.1, y=-0.2, canvas_str="⠁") == "⠃"
+
+
+def test_braille_dot_positions():
+    x = np.array([0.3, 0.5, 0, -0.1])
+    y = np.array([0.8, 0.5, 0, -0.2])
+    dot_x, dot_y = braille_dot_positions(x, y)
+    for xi, yi, dx, dy in zip(x, y, dot_x, dot_y):
+        assert braille_from_xy(dx, dy) == draw_braille(xi, yi, canvas_str=" ")
+
+
+def test_braille_mask():
+    assert braille_mask(" ") == 0
+    assert braille_mask("⣿") == 0xFF
+    assert braille_mask("\x1b[31m⠃\x1b[0m") == 0b11
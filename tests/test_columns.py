@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from tplot.columns import Column, combined_categories, combined_limits
+
+
+def test_numpy_array_is_not_copied():
+    values = np.arange(10, dtype=float)
+    column = Column(values)
+    assert np.shares_memory(column.values, values)
+    assert column.is_numerical
+
+
+def test_conversion():
+    assert Column([1, 2.5, 3]).is_numerical
+    assert Column([True, False]).is_numerical
+    assert not Column(["a", "b"]).is_numerical
+    assert Column(["eggs", 42]).categories() == ("42", "eggs")
+    assert Column([None, "spam"]).categories() == ("None", "spam")
+
+
+def test_combined():
+    columns = [Column([3, -1, 2]), Column([0.5, 7.5])]
+    assert combined_limits(columns) == (-1, 7.5)
+    columns = [Column(["spam", "eggs"]), Column(["bacon", "spam"])]
+    assert combined_categories(columns) == ("bacon", "eggs", "spam")
+
+
+def test_summary_statistics():
+    column = Column([3.0, np.nan, -1.0, np.inf, 2.0])
+    assert (column.min, column.max, column.count) == (-1.0, 3.0, 3)
+    column = Column([np.nan])
+    assert (column.min, column.max, column.count) == (None, None, 0)
+    column = Column(np.arange(5))
+    assert (column.min, column.max, column.count) == (0, 4, 5)
+
+
+def test_factorize():
+    categories, codes = Column(["spam", "eggs", "spam", 42]).factorize()
+    np.testing.assert_array_equal(categories, ["42", "eggs", "spam"])
+    np.testing.assert_array_equal(codes, [2, 1, 2, 0])
+
+
+def test_masked_values_are_nan():
+    column = Column(np.ma.masked_array([1, 2, 3], mask=[False, True, False]))
+    np.testing.assert_array_equal(column.values, [1, np.nan, 3])
+    assert column.count == 2
+
+
+def test_pandas():
+    pd = pytest.importorskip("pandas")
+    series = pd.Series(np.arange(10, dtype=float))
+    assert np.shares_memory(Column(series).values, series.to_numpy())
+    column = Column(pd.Series([1, None, 3], dtype="Int64"))
+    np.testing.assert_array_equal(column.values, [1, np.nan, 3])
+    column = Column(pd.Series([True, None], dtype="boolean"))
+    np.testing.assert_array_equal(column.values, [1, np.nan])
+
+
+def test_arrow():
+    pa = pytest.importorskip("pyarrow")
+    array = pa.array(np.arange(10, dtype=float))
+    assert np.shares_memory(Column(array).values, array.to_numpy())
+    np.testing.assert_array_equal(Column(pa.array([1, None])).values, [1, np.nan])
+    np.testing.assert_array_equal(
+        Column(pa.chunked_array([[True], [None]])).values, [1, np.nan]
+    )
+    assert Column(pa.array(["spam", "eggs"])).categories() == ("eggs", "spam")
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+import tplot
+
+
+def fill(grid_or_figures):
+    rng = np.random.default_rng(0)
+    grid_or_figures[0].line(np.cumsum(rng.normal(size=100)), color="red")
+    grid_or_figures[1].scatter(rng.normal(size=50) * 3, rng.normal(size=50))
+    grid_or_figures[2].hist(rng.normal(size=1000))
+    grid_or_figures[3].bar(["spam", "eggs"], [3, 5])
+
+
+def test_panels_side_by_side():
+    grid = tplot.Grid(2, 2, width=100, height=30)
+    fill([grid[0, 0], grid[0, 1], grid[1, 0], grid[1, 1]])
+    figures = [tplot.Figure(width=49, height=15) for _ in range(4)]
+    fill(figures)
+    lines = [
+        left + " " + right + " "
+        for top, bottom in ((figures[0], figures[1]), (figures[2], figures[3]))
+        for left, right in zip(str(top).split("\n"), str(bottom).split("\n"))
+    ]
+    assert str(grid) == "\n".join(lines)
+
+
+def test_shared_axes():
+    grid = tplot.Grid(1, 2, width=100, height=20, sharex=True, sharey=True)
+    grid[0, 0].scatter([0, 1], [0, 1])
+    grid[0, 1].scatter([10, 11], [-5, -4])
+    str(grid)
+    assert grid[0, 0]._xtick_values == grid[0, 1]._xtick_values
+    assert grid[0, 0]._ytick_values == grid[0, 1]._ytick_values
+    assert min(grid[0, 0]._xtick_values) <= 0 and max(grid[0, 0]._xtick_values) >= 11
+
+    grid = tplot.Grid(1, 2, width=100, height=20, sharey=True)
+    grid[0, 0].hbar([1, 2], ["spam", "eggs"])
+    grid[0, 1].scatter([0, 1], [0, 1])
+    with pytest.raises(ValueError):
+        str(grid)
+
+
+def test_workers():
+    outputs = []
+    for workers in (1, 4):
+        grid = tplot.Grid(2, 2, width=100, height=30, sharey=True, workers=workers)
+        fill([grid[0, 0], grid[0, 1], grid[1, 0], grid[1, 1]])
+        outputs.append(str(grid))
+    assert outputs[0] == outputs[1]
+
+
+def test_empty_grid():
+    with pytest.raises(ValueError):
+        str(tplot.Grid(2, 2, width=100, height=30))
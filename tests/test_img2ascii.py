@@ -1,6 +1,7 @@
 import numpy as np
 
-from tplot.img2ascii import resize
+from tplot import img2ascii
+from tplot.img2ascii import resize, value_range
 
 
 def test_nearest_neighbor_downscaling():
@@ -22,3 +23,40 @@ def test_nearest_neighbor_upscaling():
             [[0, 0, 1, 1], [0, 0, 1, 1], [1, 1, 0, 0], [1, 1, 0, 0]], dtype=np.uint8
         ),
     )
+
+
+def test_area_downscaling():
+    image = np.array(
+        [[0, 2, 4, 4], [2, 4, 4, 4], [0, 0, 8, 0], [0, 0, 0, 0]], dtype=np.uint8
+    )
+    out = resize(image, shape=(2, 2), interpolation="area")
+    np.testing.assert_array_equal(out, np.array([[2, 4], [0, 2]]))
+    # uneven blocks
+    out = resize(image, shape=(3, 2), interpolation="area")
+    np.testing.assert_array_equal(out, np.array([[1, 4], [3, 4], [0, 2]]))
+
+
+def test_area_upscaling():
+    image = np.array([[0, 1], [1, 0]], dtype=np.uint8)
+    np.testing.assert_array_equal(
+        resize(image, shape=(4, 4), interpolation="area"),
+        resize(image, shape=(4, 4)),
+    )
+
+
+def test_area_downscaling_in_chunks(monkeypatch):
+    image = np.random.default_rng(0).integers(0, 255, size=(100, 70), dtype=np.uint8)
+    expected = resize(image, shape=(30, 20), interpolation="area")
+    monkeypatch.setattr(img2ascii, "CHUNK_SIZE", 200)
+    np.testing.assert_allclose(
+        resize(image, shape=(30, 20), interpolation="area"), expected
+    )
+
+
+def test_value_range():
+    image = np.arange(10000, dtype=float).reshape(100, 100)
+    assert value_range(image) == (0, 9999)
+    # estimated from a sample of pixels
+    vmin, vmax = value_range(image, max_samples=100)
+    assert vmin == 0
+    assert 9000 < vmax <= 9999
@@ -0,0 +1,19 @@
+import numpy as np
+
+from tplot.utils import _plot_line_segment, _plot_line_segments
+
+
+def test_matches_bresenham():
+    rng = np.random.default_rng(0)
+    segments = rng.integers(-50, 50, size=(1000, 4))
+    xs, ys = _plot_line_segments(*segments.T)
+    expected = [
+        point for segment in segments for point in _plot_line_segment(*segment.tolist())
+    ]
+    assert list(zip(xs.tolist(), ys.tolist())) == expected
+
+
+def test_single_point():
+    xs, ys = _plot_line_segments([3], [4], [3], [4])
+    assert xs.tolist() == [3]
+    assert ys.tolist() == [4]
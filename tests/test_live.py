@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+import tplot
+
+
+def test_capacity():
+    series = tplot.LiveSeries(capacity=5)
+    for i in range(23):
+        series.append(i, -i)
+    assert len(series) == 5
+    np.testing.assert_array_equal(series.x.values, [18, 19, 20, 21, 22])
+    series.extend(range(100, 112), range(12))
+    np.testing.assert_array_equal(series.y.values, [7, 8, 9, 10, 11])
+
+
+def test_default_x():
+    series = tplot.LiveSeries(capacity=3)
+    series.extend([5, 6])
+    series.append(7)
+    np.testing.assert_array_equal(series.x.values, [0, 1, 2])
+    np.testing.assert_array_equal(series.y.values, [5, 6, 7])
+
+
+def test_window():
+    series = tplot.LiveSeries(capacity=100, window=2.5)
+    series.extend(np.arange(10), np.arange(10))
+    np.testing.assert_array_equal(series.x.values, [7, 8, 9])
+
+
+def test_validation():
+    with pytest.raises(ValueError):
+        tplot.LiveSeries(capacity=0)
+    with pytest.raises(ValueError):
+        tplot.LiveSeries(capacity=3).extend([1, 2], [1])
+
+
+def test_live_figure_matches_static_figure():
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=300)
+    series = tplot.LiveSeries(capacity=50)
+    live_fig = tplot.Figure(width=80, height=24)
+    live_fig.line(series, label="live")
+    live_fig.scatter([0, 500], [-3, 3])
+    for i in range(0, 300, 30):
+        series.extend(np.arange(i, i + 30), data[i : i + 30])
+        static_fig = tplot.Figure(width=80, height=24)
+        static_fig.line(
+            np.arange(max(0, i - 20), i + 30),
+            data[max(0, i - 20) : i + 30],
+            label="live",
+        )
+        static_fig.scatter([0, 500], [-3, 3])
+        assert str(live_fig) == str(static_fig)
+        assert str(live_fig) == str(static_fig)  # replayed from cache
+
+
+def test_shared_series():
+    # each figure refits its scales when data it shares with another figure changes
+    series = tplot.LiveSeries(capacity=100)
+    series.extend(np.arange(10))
+    figures = [tplot.Figure(width=60, height=15) for _ in range(2)]
+    grid = tplot.Grid(1, 2, width=81, height=15)
+    for fig in figures + [grid[0, 0], grid[0, 1]]:
+        fig.line(series)
+    for _ in range(2):
+        outputs = [str(fig) for fig in figures]
+        str(grid)
+        assert outputs[0] == outputs[1]
+        series.extend(np.arange(10, 40))
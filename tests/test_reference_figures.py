@@ -1,3 +1,4 @@
+import io
 from pathlib import Path
 
 import numpy as np
@@ -60,6 +61,11 @@ def test_ascii_fallback():
     fig.image(gradient)
     assert ascii_only(str(fig))
 
+    fig.clear()
+    fig.line(range(10), marker="braille")
+    fig.text(x=2, y=5, text="⣿ braille ⠁")
+    assert ascii_only(str(fig))
+
 
 def test_figure_too_small_error():
     fig = tplot.Figure(width=1, height=1)
@@ -230,3 +236,138 @@ def test_y_axis_direction():
     fig = tplot.Figure(width=80, height=24, y_axis_direction="up")
     fig.image(gradient)
     assert equal_to_file(str(fig), "y_axis_up.txt")
+
+
+def test_numpy_input():
+    x, y = datasets["anscombe"]
+    for method in ("scatter", "line"):
+        for marker in ("•", "braille"):
+            list_fig = tplot.Figure(width=80, height=24)
+            getattr(list_fig, method)(x, y, marker=marker)
+            array_fig = tplot.Figure(width=80, height=24)
+            getattr(array_fig, method)(np.array(x), np.array(y), marker=marker)
+            assert str(array_fig) == str(list_fig)
+
+
+def test_line_downsample():
+    rng = np.random.default_rng(0)
+    y = np.cumsum(rng.normal(size=10000))
+    for x in (np.arange(len(y)), np.cumsum(rng.normal(size=len(y)))):
+        for marker in ("braille", "o"):
+            figs = []
+            for downsample in (True, False):
+                fig = tplot.Figure(width=80, height=24)
+                fig.line(x, y, marker=marker, downsample=downsample)
+                figs.append(str(fig))
+            assert figs[0] == figs[1]
+
+
+def test_output_streams():
+    fig = tplot.Figure(width=80, height=24)
+    fig.scatter(*datasets["anscombe"], color="red")
+    assert "\n".join(fig.iter_lines()) == str(fig)
+    f = io.StringIO()
+    fig.show(file=f, flush=True)
+    assert f.getvalue() == str(fig) + "\n"
+
+
+def test_hist():
+    for marker in ("█", "braille"):
+        fig = tplot.Figure(width=80, height=24)
+        fig.hist(datasets["anscombe"][1], bins=5, marker=marker)
+        filename = f"{'braille_' if marker == 'braille' else ''}hist_anscombe.txt"
+        assert equal_to_file(str(fig), filename)
+
+    with_nan = tplot.Figure(width=80, height=24)
+    with_nan.hist([1, 2, np.nan, 2, 3])
+    without_nan = tplot.Figure(width=80, height=24)
+    without_nan.hist([1.0, 2.0, 2.0, 3.0])
+    assert str(with_nan) == str(without_nan)
+
+    # no data in range, which cannot be normalized, so the density is drawn like the (zero) counts
+    density = tplot.Figure(width=80, height=24)
+    density.hist([1, 2, 3], range=(5, 6), density=True)
+    counts = tplot.Figure(width=80, height=24)
+    counts.hist([1, 2, 3], range=(5, 6))
+    assert str(density) == str(counts)
+
+    with pytest.raises(ValueError):
+        tplot.Figure().hist(["spam", "eggs"])
+
+
+def test_density():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=100000)
+    y = x + rng.normal(size=len(x))
+    fig = tplot.Figure(width=80, height=24)
+    fig.density(x, y, log=True)
+    assert equal_to_file(str(fig), "density.txt")
+
+    # the cell with the most points gets the darkest character, others are lighter but still visible
+    fig = tplot.Figure(width=80, height=24)
+    fig.density([0, 0, 0, 1, 2], [0, 0, 0, 1, 2])
+    assert str(fig).count("█") == 1
+    assert str(fig).count("▒") == 2
+
+    fig = tplot.Figure(width=80, height=24, ascii=True)
+    fig.density(x, y)
+    assert ascii_only(str(fig))
+
+
+def test_missing_values():
+    x, y = datasets["anscombe"]
+    y_missing = np.array(y)
+    y_missing[[3, 7]] = np.nan
+    for method in ("scatter", "bar", "hbar"):
+        with_nan = tplot.Figure(width=80, height=24)
+        getattr(with_nan, method)(x, y_missing)
+        without_nan = tplot.Figure(width=80, height=24)
+        getattr(without_nan, method)(np.delete(x, [3, 7]), np.delete(y, [3, 7]))
+        assert str(with_nan) == str(without_nan)
+
+    # lines are broken where values are missing
+    y = np.sin(np.linspace(0, 10, 10000))
+    y[4000:6000] = np.nan
+    figs = []
+    for downsample in (True, False):
+        fig = tplot.Figure(width=80, height=24)
+        fig.line(y, downsample=downsample)
+        figs.append(str(fig))
+    assert figs[0] == figs[1]
+    middle_column = [line[45] for line in figs[0].splitlines()[1:-2]]
+    assert set(middle_column) == {" "}
+
+
+def test_rerender():
+    def make_figure(title, color):
+        fig = tplot.Figure(width=80, height=24, title=title)
+        fig.scatter(*datasets["anscombe"], color=color)
+        return fig
+
+    fig = make_figure("first", "red")
+    str(fig)
+    canvas = fig._canvas
+    # title (part of the cached axes layer) and colors (not part of it) change
+    fig.title = "second"
+    fig.clear()
+    fig.scatter(*datasets["anscombe"])
+    assert str(fig) == str(make_figure("second", None))
+    assert fig._canvas is canvas
+
+
+def test_rerender_changed_in_place():
+    # data isn't copied, so changes made in place show up on the next render
+    y = np.arange(20, dtype=float)
+    fig = tplot.Figure(width=60, height=20)
+    fig.line(y)
+    first = str(fig)
+    y[:] = y[::-1].copy()
+    assert str(fig) != first
+
+    image = np.zeros((10, 10))
+    image[0, 0] = 1
+    fig = tplot.Figure(width=40, height=20)
+    fig.image(image)
+    first = str(fig)
+    image[:] = 1 - image
+    assert str(fig) != first
@@ -0,0 +1,73 @@
+import io
+
+import numpy as np
+
+import tplot
+
+
+def make_figure(**kwargs):
+    fig = tplot.Figure(width=60, height=20, **kwargs)
+    series = tplot.LiveSeries(capacity=1000)
+    series.extend(np.arange(1000) ** 0.5)
+    fig.line(series, label="sqrt")
+    fig.scatter([0, 500, 999], [0, 10, 20])
+    return fig
+
+
+def test_render_stats():
+    fig = make_figure(ascii=True)
+    hooked = []
+    fig.instrument(hook=hooked.append)
+    output = str(fig)
+    stats = fig.render_stats
+    assert hooked == [stats]
+    assert [stage.name for stage in stats.stages] == [
+        "sync",
+        "ticks",
+        "scales",
+        "axes",
+        "xticklabels",
+        "plot",
+        "plot",
+        "legend",
+        "serialize",
+        "ascii",
+    ]
+    plots = [stage for stage in stats.stages if stage.name == "plot"]
+    assert [(p.plot, p.points, p.replayed) for p in plots] == [
+        ("line", 1000, False),
+        ("scatter", 3, False),
+    ]
+    assert all(stage.seconds >= 0 for stage in stats.stages)
+    assert stats.bytes == len(output.encode("utf-8")) - output.count("\n")
+    assert stats.as_dict()["stages"][5]["plot"] == "line"
+
+    # second render replays the plot of live data and reuses the axes
+    fig.show(file=io.StringIO())
+    assert len(hooked) == 2
+    assert "xticklabels" not in fig.render_stats.by_name()
+    plots = [stage for stage in fig.render_stats.stages if stage.name == "plot"]
+    assert [p.replayed for p in plots] == [True, False]
+
+
+def test_render_stats_inplace():
+    fig = make_figure()
+    fig.instrument()
+    fig.show(inplace=True, file=io.StringIO())
+    first = fig.render_stats
+    fig.show(inplace=True, file=io.StringIO())
+    assert fig.render_stats is not first
+    assert fig.render_stats.stages[-1].name == "serialize"
+    assert fig.render_stats.bytes == 0  # nothing changed
+
+
+def test_instrument_off():
+    fig = make_figure()
+    expected = str(fig)
+    assert fig.render_stats is None  # off by default
+    fig.instrument()
+    assert str(fig) == expected
+    fig.instrument(False)
+    assert fig.render_stats is None
+    assert str(fig) == expected
+    assert fig.render_stats is None
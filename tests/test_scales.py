@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import tplot
 
@@ -45,3 +46,61 @@ def test_categorical_scale():
         scale.transform(np.array(["42", "bacon", "eggs", "spam"])),
         np.array(([0, 1, 2, 3])),
     )
+
+
+def test_linear_inverse():
+    data = [-1, 3, -0.5, 4]
+    scale = tplot.scales.LinearScale()
+    scale.fit(data, target_min=0, target_max=10)
+    assert scale.inverse(scale.transform(3)) == 3
+    np.testing.assert_allclose(scale.inverse(np.array([0, 10])), np.array([-1, 4]))
+
+
+def test_linear_dtype_and_out():
+    scale = tplot.scales.LinearScale()
+    scale.fit([0, 10], target_min=0, target_max=1)
+    values = np.array([0, 5, 10])
+    transformed = scale.transform(values, dtype=np.float32)
+    assert transformed.dtype == np.float32
+    np.testing.assert_array_equal(transformed, np.array([0, 0.5, 1]))
+    out = np.empty(3)
+    assert scale.transform(values, out=out) is out
+    np.testing.assert_array_equal(out, np.array([0, 0.5, 1]))
+
+
+def test_categorical_inverse():
+    scale = tplot.scales.CategoricalScale()
+    scale.fit(["spam", "eggs", "bacon"], target_min=0, target_max=10)
+    np.testing.assert_array_equal(
+        scale.inverse(np.array([0, 5, 10])), np.array(["bacon", "eggs", "spam"])
+    )
+    with pytest.raises(KeyError):
+        scale.transform(np.array(["ham"]))
+
+
+def test_categorical_transform_codes():
+    scale = tplot.scales.CategoricalScale()
+    scale.fit(["bacon", "eggs", "spam"])
+    np.testing.assert_array_equal(
+        scale.transform_codes(np.array(["eggs", "spam"]), np.array([1, 0, 1])),
+        np.array([2, 1, 2]),
+    )
+
+
+def test_scalars_match_arrays():
+    scale = tplot.scales.LinearScale()
+    scale.fit([-3.7, 12.1], target_min=79, target_max=0)
+    for value in [-3.7, 0.1, 3, np.float32(1.1), np.int64(12)]:
+        transformed = scale.transform(value)
+        assert isinstance(transformed, float)
+        assert transformed == scale.transform(np.array([value]))[0]
+        assert scale.inverse(value) == scale.inverse(np.array([value]))[0]
+
+    scale = tplot.scales.CategoricalScale()
+    scale.fit(["spam", "eggs", 42], target_min=0, target_max=10)
+    for value in ["spam", "eggs", 42, "42"]:
+        assert scale.transform(value) == scale.transform(np.array([value]))[0]
+    for value in [-1, 2.5, 5, 7.5, 11]:
+        assert scale.inverse(value) == scale.inverse(np.array([value]))[0]
+    with pytest.raises(KeyError):
+        scale.transform("ham")
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+import pytest
+
+import tplot
+from tplot import utils
+
+
+def test_lazy_import():
+    # importing tplot itself doesn't import anything heavy, or wrap stdout
+    code = (
+        "import sys; stdout = sys.stdout; import tplot; "
+        "assert not {'numpy', 'colorama', 'importlib.metadata'} & set(sys.modules); "
+        "assert sys.stdout is stdout; "
+        "tplot.Figure; assert 'numpy' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_submodules():
+    # submodules can be reached as attributes right after `import tplot`, like before imports were lazy
+    code = "import tplot; tplot.scales.LinearScale; tplot.utils.unicode_supported"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_public_names():
+    assert tplot.Figure is tplot.figure.Figure
+    assert isinstance(tplot.__version__, str)
+    assert set(tplot.__all__) <= set(dir(tplot))
+    with pytest.raises(AttributeError):
+        tplot.Figur
+
+
+def test_unicode_supported(monkeypatch):
+    class Stdout:
+        encoding = "ascii"
+
+    monkeypatch.setattr(sys, "stdout", Stdout)
+    assert not utils.unicode_supported()
+    assert tplot.Figure(width=40, height=10).ascii_only
+    Stdout.encoding = "utf-8"
+    assert utils.unicode_supported()
@@ -0,0 +1,69 @@
+import re
+
+import numpy as np
+
+import tplot
+from tplot.terminal import frame_diff, render_cells
+
+
+def emulate(screen, cursor, output):
+    """Applies output containing plain characters, carriage returns and relative cursor movements to a screen."""
+    row, col = cursor
+    for match in re.finditer(r"\x1b\[(\d+)([ABC])|(\r)|(.)", output, re.DOTALL):
+        n, direction, carriage_return, char = match.groups()
+        if direction == "A":
+            row -= int(n)
+        elif direction == "B":
+            row += int(n)
+        elif direction == "C":
+            col += int(n)
+        elif carriage_return:
+            col = 0
+        else:
+            screen[row][col] = char
+            col += 1
+    return row, col
+
+
+def test_frame_diff():
+    rng = np.random.default_rng(0)
+    previous = rng.choice([ord("a"), ord("b"), ord(" ")], size=(10, 30))
+    current = previous.copy()
+    current[rng.random(size=current.shape) < 0.1] = ord("x")
+    colors = np.zeros(current.shape, dtype=np.uint8)
+    screen = [list(map(chr, row)) for row in previous.tolist()] + [[" "] * 30]
+    cursor = emulate(screen, (10, 0), frame_diff((previous, colors), (current, colors)))
+    assert cursor == (10, 0)
+    assert screen[:10] == [list(map(chr, row)) for row in current.tolist()]
+
+
+def test_no_changes():
+    frame = (np.array([[97, 98, 99]]), np.array([[0, 1, 0]]))
+    assert frame_diff(frame, frame) == ""
+
+
+def test_show_inplace(capsys):
+    series = tplot.LiveSeries(capacity=100)
+    fig = tplot.Figure(width=80, height=24)
+    fig.line(series)
+    series.extend(np.sin(np.linspace(0, 10, 100)))
+    fig.show(inplace=True)
+    full = capsys.readouterr().out
+    assert full == str(fig) + "\n"
+    series.append(0.5)
+    fig.show(inplace=True)
+    diff = capsys.readouterr().out
+    assert 0 < len(diff) < len(full)
+
+
+def test_render_cells():
+    codepoints = np.array([ord(char) for char in "ab⠃"])
+    colors = np.array([0, 2, 0])
+    assert render_cells(codepoints, colors) == "a\x1b[31mb\x1b[0m⠃"
+
+
+def test_render_cells_color_runs():
+    # a single pair of escape sequences for each run of cells of the same color
+    codepoints = np.array([ord(char) for char in "abcdef"])
+    colors = np.array([0, 2, 2, 2, 5, 0])
+    assert render_cells(codepoints, colors) == "a\x1b[31mbcd\x1b[0m\x1b[34me\x1b[0mf"
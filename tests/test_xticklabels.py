@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+
 import tplot
 from tplot.utils import _optimize_xticklabel_anchors
 
@@ -13,7 +16,7 @@ def test_boundaries():
     anchors = _optimize_xticklabel_anchors(
         tick_positions=[0, 20], labels=["0.0", "2.0"], width=21
     )
-    assert anchors == [[0, 2], [18, 21]]
+    assert anchors == [[0, 3], [18, 21]]
 
 
 def test_margin():
@@ -25,7 +28,7 @@ def test_margin():
 
 def test_pruning():
     """
-    Tests that labels are shortened if they don't fit and they don't extend beyond the previous or next tick.
+    Tests that labels are shortened if they don't fit, without overlapping and without extending beyond the previous or next tick.
     """
     anchors = _optimize_xticklabel_anchors(
         tick_positions=[3, 5, 7],
@@ -36,7 +39,7 @@ def test_pruning():
         ],
         width=10,
     )
-    assert anchors == [[0, 5], [4, 6], [6, 10]]
+    assert anchors == [[0, 4], [5, 6], [7, 10]]
 
 
 def test_complex():
@@ -51,4 +54,51 @@ def test_complex():
         ],
         width=60,
     )
-    assert anchors == [[0, 16], [16, 34], [34, 39], [39, 48], [48, 60]]
+    assert anchors == [[1, 16], [17, 32], [33, 38], [39, 48], [49, 60]]
+
+
+def check_anchors(anchors, tick_positions, width, margin):
+    shown = [
+        (anchor, tick_pos)
+        for anchor, tick_pos in zip(anchors, tick_positions)
+        if anchor[0] < anchor[1]
+    ]
+    for (start, end), tick_pos in shown:
+        assert 0 <= start <= tick_pos < end <= width
+    for (previous, _), (next, _) in zip(shown, shown[1:]):
+        assert previous[1] + margin <= next[0]
+
+
+@pytest.mark.parametrize("margin", [1, 2])
+def test_many_ticks(margin):
+    tick_positions = list(range(0, 1000, 7))
+    labels = [str(i) for i in range(len(tick_positions))]
+    anchors = _optimize_xticklabel_anchors(
+        tick_positions=tick_positions, labels=labels, width=1000, margin=margin
+    )
+    check_anchors(anchors, tick_positions, 1000, margin)
+    assert all(
+        end - start == len(label) for (start, end), label in zip(anchors, labels)
+    )
+
+
+def test_thin():
+    tick_positions = [7, 13, 19, 25, 31, 38, 44, 50, 56, 62, 69]
+    labels = [f"{v:.3g}" for v in range(-3500, 2000, 500)]
+    anchors = _optimize_xticklabel_anchors(
+        tick_positions=tick_positions, labels=labels, width=70, margin=1, thin=True
+    )
+    check_anchors(anchors, tick_positions, 70, 1)
+    shown = [label for (start, end), label in zip(anchors, labels) if end > start]
+    assert shown == labels[::2]
+    for (start, end), label in zip(anchors, labels):
+        assert end - start in (0, len(label))  # left out or shown in full
+
+
+def test_figure_labels_dont_touch():
+    fig = tplot.Figure(width=70, height=10)
+    fig.scatter(np.linspace(-3500, 2000, 10), np.arange(10))
+    label_row = str(fig).splitlines()[-1]
+    labels = label_row.split()
+    assert len(labels) > 1
+    assert all(float(label) in fig._xtick_values for label in labels)
@@ -1,5 +1,55 @@
-from importlib.metadata import version
+from importlib import import_module
 
-from .figure import Figure
+# recognized by type checkers, without importing `typing`
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .batch import render_many
+    from .figure import Figure
+    from .grid import Grid
+    from .live import LiveSeries
+    from .stats import RenderStats
 
-__version__ = version(__name__)
+# public names and their modules, which are only imported when first used, so `import tplot` itself is fast
+_LAZY = {
+    "render_many": "batch",
+    "Figure": "figure",
+    "Grid": "grid",
+    "LiveSeries": "live",
+    "RenderStats": "stats",
+}
+
+__all__ = list(_LAZY)
+
+# submodules, which used to be imported along with the public names and are also imported on first use
+_SUBMODULES = {
+    "batch",
+    "braille",
+    "columns",
+    "figure",
+    "grid",
+    "img2ascii",
+    "live",
+    "scales",
+    "stats",
+    "terminal",
+    "utils",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        value = getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    elif name == "__version__":
+        from importlib.metadata import version
+
+        value = version(__name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {"__version__"})
@@ -0,0 +1,134 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .figure import Figure
+
+PLOT_KINDS = ("scatter", "line", "bar", "hbar", "hist", "density", "text", "image")
+
+# arrays of at least this many bytes are passed to worker processes through shared memory instead of being pickled
+SHARED_MEMORY_THRESHOLD = 2**20
+
+
+class _SharedArray(NamedTuple):
+    """Reference to a NumPy array in shared memory."""
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+def render_many(
+    specs: Iterable[dict], workers: Optional[int] = None
+) -> Iterator[Optional[str]]:
+    """
+    Renders many figures in parallel, using a pool of worker processes.
+
+    Each figure is described by a spec: a dictionary of `Figure` arguments (e.g. `"title"`, `"width"`),
+    with a list of plots under `"plots"`. Each plot is a dictionary with the name of the `Figure` method under `"kind"`,
+    and its arguments. For example::
+
+        {"title": "web-1", "width": 80, "height": 20, "plots": [{"kind": "line", "x": t, "y": cpu, "label": "cpu"}]}
+
+    If the spec has a `"file"` path, the figure is written to that file (in UTF-8) by the worker.
+
+    Large NumPy arrays in the plot arguments are passed to the workers through shared memory, instead of being pickled.
+
+    Args:
+        specs: Figure specs. These are consumed lazily, so this can be a generator.
+        workers: Number of worker processes. Defaults to the number of CPUs. With 1, figures are rendered in this process.
+    Returns:
+        Iterator over the rendered figures as strings (or `None` for figures written to a file), in the order of `specs`.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for spec in specs:
+            yield _render(spec)
+        return
+
+    pending = deque()  # (future, shared memory segments) in order of submission
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        try:
+            for spec in specs:
+                segments: List[SharedMemory] = []
+                pending.append(
+                    (pool.submit(_render, _to_shared_memory(spec, segments)), segments)
+                )
+                # limit the number of figures (and shared memory) in flight
+                if len(pending) >= 2 * workers:
+                    yield _result(*pending.popleft())
+            while pending:
+                yield _result(*pending.popleft())
+        finally:
+            for future, segments in pending:
+                future.cancel()
+                _release(segments)
+
+
+def _result(future, segments: List[SharedMemory]) -> Optional[str]:
+    try:
+        return future.result()
+    finally:
+        _release(segments)
+
+
+def _release(segments: List[SharedMemory]) -> None:
+    for segment in segments:
+        segment.close()
+        segment.unlink()
+
+
+def _to_shared_memory(spec: dict, segments: List[SharedMemory]) -> dict:
+    """Returns a copy of `spec` with large arrays moved to shared memory (appending the segments to `segments`)."""
+    plots = []
+    for plot in spec.get("plots", []):
+        plot = dict(plot)
+        for key, value in plot.items():
+            if (
+                isinstance(value, np.ndarray)
+                and value.nbytes >= SHARED_MEMORY_THRESHOLD
+            ):
+                segment = SharedMemory(create=True, size=value.nbytes)
+                segments.append(segment)
+                shared = np.ndarray(value.shape, dtype=value.dtype, buffer=segment.buf)
+                np.copyto(shared, value)
+                del shared  # segment can't be closed while viewed
+                plot[key] = _SharedArray(segment.name, value.shape, value.dtype.str)
+        plots.append(plot)
+    return {**spec, "plots": plots}
+
+
+def _render(spec: dict) -> Optional[str]:
+    """Renders a figure spec, in a worker process (or not)."""
+    spec = dict(spec)
+    plots = spec.pop("plots", [])
+    file = spec.pop("file", None)
+    segments = []
+    fig = Figure(**spec)
+    try:
+        for plot in plots:
+            plot = dict(plot)
+            kind = plot.pop("kind", None)
+            if kind not in PLOT_KINDS:
+                raise ValueError(f"Unsupported plot kind: {kind}")
+            for key, value in plot.items():
+                if isinstance(value, _SharedArray):
+                    segments.append(SharedMemory(value.name))
+                    plot[key] = np.ndarray(
+                        value.shape, dtype=value.dtype, buffer=segments[-1].buf
+                    )
+            getattr(fig, kind)(**plot)
+            del plot
+        if file is None:
+            return str(fig)
+        with open(file, "w", encoding="utf-8") as f:
+            fig.show(file=f)
+        return None
+    finally:
+        fig.clear()  # drop views of shared memory, so it can be closed
+        for segment in segments:
+            segment.close()
@@ -1,4 +1,13 @@
-from typing import Iterable
+from typing import Iterable, Tuple
+
+import numpy as np
+
+BRAILLE_OFFSET = 0x2800
+
+# Bit of each dot in a braille codepoint, indexed by [x, y] position of the dot (ISO/TR 11548-1 dot order).
+DOT_BITS = np.array(
+    [[0x01, 0x02, 0x04, 0x40], [0x08, 0x10, 0x20, 0x80]], dtype=np.uint8
+)
 
 
 def get_braille(s: str) -> str:
@@ -19,21 +28,17 @@ def get_braille(s: str) -> str:
     '11111111' = ⣿
     '00000000' = ⠀ (empty braille character)
     """
-    s = (
-        s[:3] + s[4:7] + s[3] + s[7]
-    )  # rearrange ISO/TR 11548-1 dot order to something more suitable
-    return chr(0x2800 + int(s[::-1], 2))
+    mask = 0
+    for i, dot in enumerate(s):
+        if dot == "1":
+            mask |= int(DOT_BITS[i // 4, i % 4])
+    return chr(BRAILLE_OFFSET + mask)
 
 
 def braille_bin(char: str) -> str:
     """Inverse of get_braille()"""
-    o = ord(char) - 0x2800
-    s = format(o, "b").rjust(8, "0")
-    s = s[::-1]
-    s = (
-        s[:3] + s[6] + s[3:6] + s[7]
-    )  # rearrange ISO/TR 11548-1 dot order to something more suitable
-    return s
+    mask = braille_mask(char)
+    return "".join("1" if mask & bit else "0" for bit in DOT_BITS.ravel().tolist())
 
 
 def is_braille(char: str) -> bool:
@@ -41,6 +46,17 @@ def is_braille(char: str) -> bool:
     return isinstance(char, str) and 0x2800 <= ord(char[0]) <= 0x28FF
 
 
+def braille_mask(s: str) -> int:
+    """
+    Returns the dot mask of the first braille character in `s` (which may contain ANSI escape characters),
+    or 0 if there is none. The mask is the offset of the braille character from U+2800.
+    """
+    for character in s:
+        if is_braille(character):
+            return ord(character) - BRAILLE_OFFSET
+    return 0
+
+
 def braille_from_xy(x: int, y: int) -> str:
     """
     Returns braille character with dot at x, y position filled in.
@@ -48,9 +64,7 @@ def braille_from_xy(x: int, y: int) -> str:
     """
     if not 0 <= x <= 1 or not 0 <= y <= 3:
         raise ValueError("Invalid braille dot position.")
-    s = ["0"] * 8
-    s[x * 4 + y] = "1"
-    return get_braille("".join(s))
+    return chr(BRAILLE_OFFSET + int(DOT_BITS[x, y]))
 
 
 def combine_braille(braille: Iterable[str]) -> str:
@@ -58,12 +72,10 @@ def combine_braille(braille: Iterable[str]) -> str:
     Returns braille character that combines dots of input braille characters.
     Example: combine_braille("⠁⠂") returns "⠃"
     """
-    out_bin = 0b00000000
+    mask = 0
     for char in braille:
-        braille_b = braille_bin(char)
-        out_bin |= int(braille_b, 2)
-    s = format(out_bin, "b").rjust(8, "0")
-    return get_braille(s)
+        mask |= ord(char) - BRAILLE_OFFSET
+    return chr(BRAILLE_OFFSET + mask)
 
 
 def draw_braille(x: float, y: float, canvas_str=None) -> str:
@@ -73,9 +85,22 @@ def draw_braille(x: float, y: float, canvas_str=None) -> str:
     """
     x = round((x + 0.500000001) % 1)  # 0 or 1. 0.500000001 so it rounds half up.
     y = 3 - round((-y + 0.375000001) % 1 * 4) % 4  # 0, 1, 2, or 3
-    out = braille_from_xy(x, y)
-    for character in canvas_str:
-        if is_braille(character):
-            out = combine_braille([out, character])
-            break
-    return out
+    return chr(BRAILLE_OFFSET + (int(DOT_BITS[x, y]) | braille_mask(canvas_str)))
+
+
+def braille_masks(codepoints: np.ndarray) -> np.ndarray:
+    """Vectorized version of `braille_mask()` for an array of unicode codepoints of single characters."""
+    is_braille = (codepoints >= BRAILLE_OFFSET) & (codepoints <= BRAILLE_OFFSET + 0xFF)
+    return np.where(is_braille, codepoints - BRAILLE_OFFSET, 0).astype(np.uint8)
+
+
+def braille_dot_positions(
+    x: np.ndarray, y: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized version of the dot position calculation in `draw_braille()`.
+    Returns the x (0 or 1) and y (0, 1, 2, or 3) positions of the dots within their braille characters.
+    """
+    dot_x = np.round(np.mod(x + 0.500000001, 1)).astype(np.int64)
+    dot_y = 3 - np.mod(np.round(np.mod(-y + 0.375000001, 1) * 4), 4).astype(np.int64)
+    return dot_x, dot_y
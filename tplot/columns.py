@@ -0,0 +1,155 @@
+from numbers import Number
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+
+def _from_arrow(values) -> np.ndarray:
+    """Converts an object implementing the Arrow PyCapsule interface (e.g. a pyarrow or polars array) to a NumPy array."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if hasattr(values, "__arrow_c_stream__"):
+        array = pa.chunked_array(values)
+    else:
+        array = pa.array(values)
+    numerical = (
+        pa.types.is_integer(array.type)
+        or pa.types.is_floating(array.type)
+        or pa.types.is_boolean(array.type)
+    )
+    if numerical and array.null_count:
+        array = pc.fill_null(array.cast(pa.float64()), np.nan)
+    if isinstance(array, pa.ChunkedArray):
+        return array.to_numpy()
+    return array.to_numpy(zero_copy_only=False)  # still no copy if not needed
+
+
+def _missing_as_nan(values):
+    """Converts nullable numerical values (masked NumPy arrays, pandas extension arrays) to floats with NaN for missing values."""
+    if isinstance(values, np.ma.MaskedArray):
+        if values.dtype.kind in "iufb" and np.ma.is_masked(values):
+            return values.astype(float).filled(np.nan)
+        return values.data
+    dtype = getattr(values, "dtype", None)
+    if (
+        hasattr(values, "to_numpy")
+        and getattr(dtype, "na_value", None) is not None
+        and getattr(dtype, "kind", None) in "iufb"
+    ):
+        return values.to_numpy(dtype=float, na_value=np.nan)
+    return values
+
+
+def _to_array(values: Iterable) -> np.ndarray:
+    """
+    Converts `values` to a 1D NumPy array.
+    NumPy arrays and anything else exposing its data through `__array__`, the buffer protocol or the Arrow PyCapsule interface
+    (e.g. pandas series, pyarrow arrays) are returned as a view (no copy) where possible, anything else is converted once.
+    Numbers end up as a numerical array, anything else as a string array.
+    Missing values in nullable numerical data end up as NaN, which are left out when drawing.
+    """
+    if hasattr(values, "__arrow_c_array__") or hasattr(values, "__arrow_c_stream__"):
+        try:
+            values = _from_arrow(values)
+        except ImportError:  # pyarrow is optional, try `__array__` instead
+            pass
+    values = _missing_as_nan(values)
+    array = np.asarray(values)
+    if array.ndim != 1:
+        array = array.reshape(-1)
+    if array.dtype.kind == "b":
+        return array.view(np.uint8)
+    if array.dtype.kind == "O":
+        if all(isinstance(value, Number) for value in array):
+            return array.astype(float)
+        return array.astype(str)
+    if array.dtype.kind not in "iufU":
+        return array.astype(str)
+    return array
+
+
+class Column:
+    """
+    Data along a single axis of a plot, stored as a NumPy array.
+    Summary statistics (`min`, `max` and `count` of finite values) are computed once on creation.
+
+    Args:
+        values: Numerical or categorical (e.g. strings) values.
+    """
+
+    # changes when the values change. Only tracked for live data: other values may be changed in place by the caller
+    version: Optional[int] = None
+
+    def __init__(self, values: Iterable) -> None:
+        self.values = _to_array(values)
+        self._summarize()
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def is_numerical(self) -> bool:
+        return self.values.dtype.kind in "iuf"
+
+    def sync(self) -> bool:
+        """Updates the column if the data it represents changed. Returns True if it did."""
+        return False
+
+    def _summarize(self) -> None:
+        """Computes summary statistics once, so axes can be fitted without scanning the data again."""
+        self._categories = None
+        self._factorized = None
+        self.min = self.max = None
+        if not self.is_numerical:
+            self.count = len(self.values)
+            self.factorize()
+            return
+        if self.values.dtype.kind == "f":
+            finite = np.isfinite(self.values)
+            self.count = int(np.count_nonzero(finite))
+            # only copy the finite values if there are missing or infinite ones
+            values = (
+                self.values if self.count == len(self.values) else self.values[finite]
+            )
+            if self.count:
+                self.min = values.min().item()
+                self.max = values.max().item()
+        else:
+            self.count = len(self.values)
+            if self.count:
+                self.min = self.values.min().item()
+                self.max = self.values.max().item()
+
+    def factorize(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the unique string representations of the values (sorted), and the index of each value into those.
+        Categorical columns are factorized once, so axes and scales only deal with the (few) unique values.
+        """
+        if self._factorized is None:
+            self._factorized = np.unique(self.values.astype(str), return_inverse=True)
+        return self._factorized
+
+    def categories(self) -> tuple:
+        """Returns the unique string representations of the values, sorted."""
+        if self._categories is None:
+            self._categories = tuple(self.factorize()[0].tolist())
+        return self._categories
+
+
+def all_numerical(columns: Iterable[Column]) -> bool:
+    """Returns True if all given columns are numerical."""
+    return all(column.is_numerical for column in columns)
+
+
+def combined_limits(columns: Iterable[Column]) -> tuple:
+    """Returns the minimum and maximum finite value over all given (numerical) columns."""
+    columns = [column for column in columns if column.count]
+    if not columns:
+        raise ValueError("No finite values to plot")
+    return min(column.min for column in columns), max(column.max for column in columns)
+
+
+def combined_categories(columns: Iterable[Column]) -> tuple:
+    """Returns the sorted union of the categories of all given columns."""
+    return tuple(sorted(set().union(*(column.categories() for column in columns))))
@@ -1,18 +1,46 @@
+import sys
+from contextlib import nullcontext
 from functools import cached_property, partial
 from numbers import Number
 from shutil import get_terminal_size
-from typing import Callable, Iterable, List, Optional, Tuple
+from time import perf_counter
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 import numpy as np
-from colorama import init
-from termcolor import colored
 
 from . import utils
-from .braille import draw_braille, is_braille
-from .img2ascii import img2ascii
+from .braille import (
+    BRAILLE_OFFSET,
+    DOT_BITS,
+    braille_dot_positions,
+    braille_masks,
+    is_braille,
+)
+from .columns import Column, all_numerical, combined_categories, combined_limits
+from .img2ascii import COLORMAPS, img2ascii, shade, value_range
+from .live import LiveSeries
 from .scales import CategoricalScale, LinearScale
+from .stats import RenderStats
+from .terminal import (
+    CLEAR_SCREEN,
+    color_index,
+    frame_diff,
+    init_colors,
+    render_rows,
+)
 
-init()
+# stands in for a stage of `RenderStats` when not collecting stats
+_NO_STAGE = nullcontext()
 
 
 ASCII_FALLBACK = {
@@ -29,6 +57,19 @@ ASCII_FALLBACK = {
     "·": ".",
 }
 
+# translation table for str.translate(), which also replaces braille characters
+_ASCII_TRANSLATION = str.maketrans(
+    {
+        **ASCII_FALLBACK,
+        **{chr(BRAILLE_OFFSET + mask): "." if mask else " " for mask in range(256)},
+    }
+)
+
+
+def _codepoints(string: str) -> np.ndarray:
+    """Returns the unicode codepoints of `string`."""
+    return np.frombuffer(string.encode("utf-32-le"), dtype="<u4")
+
 
 class Figure:
     """
@@ -40,6 +81,7 @@ class Figure:
         title: Title of the figure.
         width: Width of the figure in number of characters. Defaults to the terminal window width, or falls back to 80.
         height: Height of the figure in number of characters. Defaults to the terminal window height, or falls back to 24.
+                The terminal size is read once, when the first figure is created.
         legendloc: Legend location. Supported values are `"topleft"`, `"topright"`, `"bottomleft"`, and `"bottomright"`.
         ascii: Set to `True` to only use ascii characters. Defaults to trying to detect if unicode is supported in the terminal.
         y_axis_direction: Set to `"up"` to have Y axis point up (conventional for graphs), `"down"` to have Y axis point down
@@ -71,11 +113,13 @@ class Figure:
 
         self._y_axis_direction = y_axis_direction
 
+        init_colors()
+
         self.ascii_only = ascii
         if not self.ascii_only:
             self.ascii_only = not utils.unicode_supported()
 
-        term_width, term_height = get_terminal_size(fallback=(80, 24))
+        term_width, term_height = utils.terminal_size()
         term_height -= 1  # room for prompt
         self.width = width if width else term_width
         self.height = height if height else term_height
@@ -83,18 +127,33 @@ class Figure:
         # gather stuff to plot before actually drawing it
         self._plots: List[Callable] = []
         self._labels: List[Tuple[str, str]] = []
+        # drawing operations of each plot during the last render
+        self._rendered: Dict[Callable, tuple] = {}
+        # last frame shown in place, and the terminal size at the time
+        self._shown: tuple = (None, None)
+        # canvas reused between renders, and the title and axes drawn on it (which only change with the layout)
+        self._canvas: Optional[np.ndarray] = None
+        self._colors: Optional[np.ndarray] = None
+        self._chrome: tuple = (None, None)
+        # versions of the data the scales were last fitted to
+        self._fitted_versions: list = []
+        # render stats, only collected when enabled with `instrument()`
+        self.render_stats: Optional[RenderStats] = None
+        self._instrumented = False
+        self._stats_hook: Optional[Callable[[RenderStats], None]] = None
+        self._stats: Optional[RenderStats] = None
 
     @property
-    def _x(self):
-        return tuple([x for plot in self._plots for x in plot.keywords["x"]])
+    def _x(self) -> List[Column]:
+        return [plot.keywords["x"] for plot in self._plots]
 
     @property
-    def _y(self):
-        return tuple([y for plot in self._plots for y in plot.keywords["y"]])
+    def _y(self) -> List[Column]:
+        return [plot.keywords["y"] for plot in self._plots]
 
     @cached_property
     def _yscale(self):
-        if utils._is_numerical(self._y):
+        if all_numerical(self._y):
             scale = LinearScale()
         else:
             scale = CategoricalScale()
@@ -102,26 +161,37 @@ class Figure:
         target_max = -self.height + 1 + bool(self.title)
         if self._y_axis_direction == "down":
             target_min, target_max = target_max, target_min
-        scale.fit(self._y, target_min, target_max)
-        if utils._is_numerical(self._y):
-            # refit scale to tick values, since those lay just outside the input data range
-            scale.fit(self._ytick_values, target_min, target_max)
+        # for numerical data, fit scale to tick values, since those lay just outside the input data range
+        scale.fit(self._ytick_values, target_min, target_max)
         return scale
 
     @cached_property
     def _xscale(self):
-        if utils._is_numerical(self._x):
+        if all_numerical(self._x):
             scale = LinearScale()
         else:
             scale = CategoricalScale()
         target_min = self._yax_width
         target_max = self.width - 1
-        scale.fit(self._x, target_min, target_max)
-        if utils._is_numerical(self._x):
-            # refit scale to tick values, since those lay just outside the input data range
-            scale.fit(self._xtick_values, target_min, target_max)
+        # for numerical data, fit scale to tick values, since those lay just outside the input data range
+        scale.fit(self._xtick_values, target_min, target_max)
         return scale
 
+    def _transform(self, scale, column: Column) -> np.ndarray:
+        """Maps the values of `column` to canvas coordinates. Categorical columns are mapped by their category table."""
+        if isinstance(scale, CategoricalScale):
+            return scale.transform_codes(*column.factorize())
+        return scale.transform(column.values)
+
+    def _transform_finite(self, x: Column, y: Column) -> Tuple[np.ndarray, np.ndarray]:
+        """Maps columns to canvas coordinates, leaving out points with missing (NaN) or infinite values."""
+        xs = self._transform(self._xscale, x)
+        ys = self._transform(self._yscale, y)
+        if x.count < len(x) or y.count < len(y):
+            finite = np.isfinite(xs) & np.isfinite(ys)
+            xs, ys = xs[finite], ys[finite]
+        return xs, ys
+
     def _xax_height(self) -> int:
         return 2 + bool(self._xlabel)
 
@@ -144,20 +214,23 @@ class Figure:
         return width
 
     def _center_draw(self, string, array, fillchar=" "):
-        array[:] = list(string.center(len(array), fillchar))
+        array[:] = _codepoints(string.center(len(array), fillchar))
 
     def _ljust_draw(self, string, array, fillchar=" "):
-        array[:] = list(string.ljust(len(array), fillchar))
+        array[:] = _codepoints(string.ljust(len(array), fillchar))
 
     def _rjust_draw(self, string, array, fillchar=" "):
-        array[:] = list(string.rjust(len(array), fillchar))
+        array[:] = _codepoints(string.rjust(len(array), fillchar))
 
     @cached_property
     def _ytick_values(self):
-        if utils._is_numerical(self._y):
-            return utils._best_ticks(min(self._y), max(self._y), most=self.height // 3)
+        return self._yticks_for(self._y)
+
+    def _yticks_for(self, columns: List[Column]) -> list:
+        if all_numerical(columns):
+            return utils._best_ticks(*combined_limits(columns), most=self.height // 3)
         else:  # nominal
-            values = tuple(sorted([str(v) for v in set(self._y)]))
+            values = combined_categories(columns)
             y_axis_height = self.height - bool(self.title) - self._xax_height()
             if len(values) > y_axis_height:
                 raise IndexError(
@@ -167,24 +240,27 @@ class Figure:
 
     @cached_property
     def _xtick_values(self):
-        if utils._is_numerical(self._x):
-            return utils._best_ticks(min(self._x), max(self._x), most=self.width // 5)
+        return self._xticks_for(self._x)
+
+    def _xticks_for(self, columns: List[Column]) -> list:
+        if all_numerical(columns):
+            return utils._best_ticks(*combined_limits(columns), most=self.width // 5)
         else:  # categorical
             # note this may not fit depending on the width of the figure
-            values = tuple(sorted([str(v) for v in set(self._x)]))
+            values = combined_categories(columns)
             return values
 
     def _draw_y_axis(self) -> None:
         start = round(self._yscale.transform(self._ytick_values[-1]))
         end = round(self._yscale.transform(self._ytick_values[0]))
         start, end = min(start, end), max(start, end)
-        self._canvas[start:end, self._yax_width - 1] = "│"
+        self._canvas[start:end, self._yax_width - 1] = ord("│")
         for value, pos in zip(
             self._ytick_values, self._yscale.transform(self._ytick_values)
         ):
             pos = round(pos)
             label = self._fmt(value)
-            self._canvas[pos, self._yax_width - 1] = "┤"
+            self._canvas[pos, self._yax_width - 1] = ord("┤")
             self._rjust_draw(
                 label, self._canvas[pos, bool(self._ylabel) * 2 : self._yax_width - 1]
             )
@@ -199,24 +275,31 @@ class Figure:
         # draw axis
         axis_start = round(self._xscale.transform(self._xtick_values[0]))
         axis_end = round(self._xscale.transform(self._xtick_values[-1]))
-        self._canvas[-self._xax_height(), axis_start:axis_end] = "─"
+        self._canvas[-self._xax_height(), axis_start:axis_end] = ord("─")
         # draw ticks
         for tick_pos in tick_positions:
-            self._canvas[-self._xax_height(), tick_pos] = "┬"
+            self._canvas[-self._xax_height(), tick_pos] = ord("┬")
         # draw labels
-        anchors = utils._optimize_xticklabel_anchors(
-            tick_positions=tick_positions, labels=labels, width=self.width
-        )
+        # a single space between labels keeps them centered below their ticks more often,
+        # and numbers are left out rather than shortened, since shortened numbers are wrong
+        with self._stage("xticklabels"):
+            anchors = utils._optimize_xticklabel_anchors(
+                tick_positions=tick_positions,
+                labels=labels,
+                width=self.width,
+                margin=1,
+                thin=all_numerical(self._x),
+            )
         for (start, end), label in zip(anchors, labels):
             label = label[: end - start]  # shorten label if needed
-            self._canvas[-self._xax_height() + 1, start:end] = list(label)
+            self._canvas[-self._xax_height() + 1, start:end] = _codepoints(label)
         # draw axis label
         if self._xlabel:
             xlabel = self._xlabel[: axis_end - axis_start]  # make sure it fits
             self._center_draw(xlabel, self._canvas[-1, axis_start:axis_end])
 
     def _draw_legend(self) -> None:
-        width = max([len(label) for marker, label in self._labels]) + 4
+        width = max([len(label) for marker, color, label in self._labels]) + 4
         width = max(width, len("Legend") + 2)
         height = len(self._labels) + 2
 
@@ -229,21 +312,72 @@ class Figure:
         elif self.legendloc.endswith("left"):
             left = int(self._xscale.transform(self._xtick_values[0]))
 
-        self._canvas[top, left : left + width] = list(
+        self._colors[top : top + height, left : left + width] = 0
+        self._canvas[top, left : left + width] = _codepoints(
             "┌" + "Legend".center(width - 2, "─") + "┐"
         )
-        for i, (marker, label) in enumerate(self._labels):
-            self._canvas[top + i + 1, left : left + width] = list(
+        for i, (marker, color, label) in enumerate(self._labels):
+            self._canvas[top + i + 1, left : left + width] = _codepoints(
                 "│" + "  " + label.ljust(width - 4) + "│"
             )
-            # the marker must be inserted separately in case of ANSI escape characters messing with the string length
-            self._canvas[top + i + 1, left + 1] = marker
-        self._canvas[top + len(self._labels) + 1, left : left + width] = list(
+            self._canvas[top + i + 1, left + 1] = ord(marker)
+            self._colors[top + i + 1, left + 1] = color
+        self._canvas[top + len(self._labels) + 1, left : left + width] = _codepoints(
             "└" + "─" * (width - 2) + "┘"
         )
 
-    def _prep(self, x, y, marker, color, label) -> tuple:
-        """Data preparation stuff common to all plots."""
+    def _cell_index(self, rows: np.ndarray, cols: np.ndarray) -> tuple:
+        """Wraps negative canvas indices like regular indexing does, raising `IndexError` when out of bounds."""
+        height, width = self._canvas.shape
+        if len(rows) and (
+            rows.min() < -height
+            or rows.max() >= height
+            or cols.min() < -width
+            or cols.max() >= width
+        ):
+            raise IndexError("Drawing out of bounds.")
+        return rows % height, cols % width
+
+    def _draw_braille_dots(self, x: np.ndarray, y: np.ndarray, color: int) -> None:
+        """
+        Draws braille dots at canvas positions `x`, `y` (floats, at braille resolution).
+        The dots are gathered into a dot mask per canvas cell, which are then OR-ed into the braille characters on the canvas.
+        """
+        rows, cols = self._cell_index(
+            utils._round_half_away_from_zero_array(y),
+            utils._round_half_away_from_zero_array(x),
+        )
+        dot_x, dot_y = braille_dot_positions(x, y)
+        mask = np.zeros(self._canvas.shape, dtype=np.uint8)
+        np.bitwise_or.at(mask, (rows, cols), DOT_BITS[dot_x, dot_y])
+        drawn = np.nonzero(mask)
+        self._record(self._put_braille, drawn, mask[drawn], color)
+
+    def _draw_marker(self, index, marker: str, color: int) -> None:
+        """Draws `marker` at `index` of the canvas."""
+        self._record(self._put_marker, index, marker, color)
+
+    def _record(self, func: Callable, *args) -> None:
+        """Applies a drawing operation to the canvas and records it, so it can be replayed on the next render."""
+        self._ops.append((func, args))
+        func(*args)
+
+    def _put_braille(self, index, mask: np.ndarray, color: int) -> None:
+        # add dots to braille characters that are already there
+        mask = mask | braille_masks(self._canvas[index])
+        self._canvas[index] = BRAILLE_OFFSET + mask.astype(np.uint32)
+        self._colors[index] = color
+
+    def _put_marker(self, index, marker: str, color: int) -> None:
+        self._canvas[index] = ord(marker)
+        self._colors[index] = color
+
+    def _put_cells(self, index, cells: np.ndarray, color: int = 0) -> None:
+        self._canvas[index] = cells
+        self._colors[index] = color
+
+    def _prep_data(self, x, y) -> Tuple[Column, Column]:
+        """Validates data and stores it as columns."""
         x_is_valid = x is not None and len(x) > 0
         y_is_valid = y is not None and len(y) > 0
         if not x_is_valid and not y_is_valid:
@@ -251,22 +385,30 @@ class Figure:
 
         if x_is_valid and y is None:
             # only `x` is provided, assume `x` is `y`
-            x, y = range(len(x)), x
+            x, y = np.arange(len(x)), x
         elif x is None and y_is_valid:
             # only `y` keyword argument is provided
-            x = range(len(y))
+            x = np.arange(len(y))
 
         if not len(x) == len(y):
             raise ValueError("`x` and `y` must have the same length")
+        return Column(x), Column(y)
+
+    def _prep(self, x, y, marker, color, label) -> tuple:
+        """Data preparation stuff common to all plots."""
+        if isinstance(x, LiveSeries) or isinstance(y, LiveSeries):
+            series = x if isinstance(x, LiveSeries) else y
+            x, y = series.x, series.y
+        else:
+            x, y = self._prep_data(x, y)
 
         if marker == "braille":
             marker = "⠄" if not self.ascii_only else "."
         else:
             marker = marker[0]
-        if color and not self.ascii_only:
-            marker = colored(text=marker, color=color)
+        color = 0 if self.ascii_only else color_index(color)
         if label:
-            self._labels.append((marker, label))
+            self._labels.append((marker, color, label))
         self._clear_scale_cache()
         return x, y, marker, color, label
 
@@ -291,16 +433,21 @@ class Figure:
         x, y, marker, color, label = self._prep(x, y, marker, color, label)
 
         def draw_scatter(x, y, marker):
-            for xi, yi in zip(self._xscale.transform(x), self._yscale.transform(y)):
-                if not self.ascii_only and any((is_braille(char) for char in marker)):
-                    xi = utils._round_half_away_from_zero(xi)
-                    yi = utils._round_half_away_from_zero(yi)
-                    marker = draw_braille(xi, yi, self._canvas[yi, xi])
-                    if color:
-                        marker = colored(marker, color)
-                    self._canvas[yi, xi] = marker
-                else:
-                    self._canvas[round(yi), round(xi)] = marker
+            xs, ys = self._transform_finite(x, y)
+            if not self.ascii_only and any((is_braille(char) for char in marker)):
+                self._draw_braille_dots(
+                    utils._round_half_away_from_zero_array(xs),
+                    utils._round_half_away_from_zero_array(ys),
+                    color,
+                )
+            else:
+                rows, cols = self._cell_index(
+                    np.round(ys).astype(np.int64), np.round(xs).astype(np.int64)
+                )
+                # deduplicate points that fall into the same cell
+                drawn = np.zeros(self._canvas.shape, dtype=bool)
+                drawn[rows, cols] = True
+                self._draw_marker(drawn, marker, color)
 
         self._plots.append(partial(draw_scatter, x=x, y=y, marker=marker))
 
@@ -311,6 +458,7 @@ class Figure:
         marker: str = "braille",
         color: Optional[str] = None,
         label: Optional[str] = None,
+        downsample: Union[str, bool] = "auto",
     ) -> None:
         """
         Adds line plot.
@@ -321,30 +469,47 @@ class Figure:
             marker: Marker used to draw lines. Set to `"braille"` to use braille characters.
             color: Color of marker. Supported values are `"grey"`, `"red"`, `"green"`, `"yellow"`, `"blue"`, `"magenta"`, `"cyan"`, and `"white"`.
             label: Label to use for legend.
+            downsample: Only draw the first, last, minimum and maximum point within each pixel column, which results in the exact same line.
+                        `"auto"` does this if there are many more points than pixel columns. Set to `True` to always or `False` to never do this.
         """
+        if downsample not in ("auto", True, False):
+            raise ValueError("Unsupported downsample value")
         x, y, marker, color, label = self._prep(x, y, marker, color, label)
 
         def draw_line(x, y, marker):
-            xs = self._xscale.transform(x)
-            ys = self._yscale.transform(y)
-            for (x0, x1), (y0, y1) in zip(zip(xs[:-1], xs[1:]), zip(ys[:-1], ys[1:])):
-                if not self.ascii_only and any((is_braille(char) for char in marker)):
-                    for x, y in utils._plot_line_segment(
-                        round(x0 * 2), round(y0 * 4), round(x1 * 2), round(y1 * 4)
-                    ):
-                        x = x / 2
-                        y = y / 4
-                        x_canvas = utils._round_half_away_from_zero(x)
-                        y_canvas = utils._round_half_away_from_zero(y)
-                        marker = draw_braille(x, y, self._canvas[y_canvas, x_canvas])
-                        if color:
-                            marker = colored(marker, color)
-                        self._canvas[y_canvas, x_canvas] = marker
-                else:
-                    for x, y in utils._plot_line_segment(
-                        round(x0), round(y0), round(x1), round(y1)
-                    ):
-                        self._canvas[y, x] = marker
+            xs = self._transform(self._xscale, x)
+            ys = self._transform(self._yscale, y)
+            # missing (NaN) values break the line into parts
+            parts = None
+            if x.count < len(x) or y.count < len(y):
+                finite = np.isfinite(xs) & np.isfinite(ys)
+                parts = np.cumsum(~finite)[finite]
+                xs, ys = xs[finite], ys[finite]
+            braille = not self.ascii_only and any((is_braille(char) for char in marker))
+            # braille characters have 2x4 dots per canvas cell
+            xres, yres = (2, 4) if braille else (1, 1)
+            xs = np.round(xs * xres)
+            ys = np.round(ys * yres)
+            if downsample is True or (
+                downsample == "auto" and len(xs) > 4 * self.width * xres
+            ):
+                keep = utils._m4_downsample(xs, ys, parts)
+                xs, ys = xs[keep], ys[keep]
+                parts = None if parts is None else parts[keep]
+            x0, y0, x1, y1 = xs[:-1], ys[:-1], xs[1:], ys[1:]
+            if parts is not None:
+                connected = parts[:-1] == parts[1:]
+                x0, y0, x1, y1 = (
+                    x0[connected],
+                    y0[connected],
+                    x1[connected],
+                    y1[connected],
+                )
+            px, py = utils._plot_line_segments(x0, y0, x1, y1)
+            if braille:
+                self._draw_braille_dots(px / 2, py / 4, color)
+            else:
+                self._draw_marker((py, px), marker, color)
 
         self._plots.append(partial(draw_line, x=x, y=y, marker=marker))
 
@@ -370,13 +535,15 @@ class Figure:
 
         def draw_bar(x, y, marker):
             marker = marker.replace("⠄", "⡇")  # in case of braille
-            if utils._is_numerical(self._y):
+            if all_numerical(self._y):
                 origin = self._yscale.transform(min(self._ytick_values, key=abs))
             else:
                 origin = self._yscale.transform(self._ytick_values[0])
-            for xi, yi in zip(self._xscale.transform(x), self._yscale.transform(y)):
+            for xi, yi in zip(*self._transform_finite(x, y)):
                 start, end = sorted([origin, yi])
-                self._canvas[round(start) : round(end) + 1, round(xi)] = marker
+                self._draw_marker(
+                    (slice(round(start), round(end) + 1), round(xi)), marker, color
+                )
 
         self._plots.append(partial(draw_bar, x=x, y=y, marker=marker))
 
@@ -402,16 +569,131 @@ class Figure:
 
         def draw_hbar(x, y, marker):
             marker = marker.replace("⠄", "⠒")  # in case of braille
-            if utils._is_numerical(self._x):
+            if all_numerical(self._x):
                 origin = self._xscale.transform(min(self._xtick_values, key=abs))
             else:
                 origin = self._xscale.transform(self._xtick_values[0])
-            for xi, yi in zip(self._xscale.transform(x), self._yscale.transform(y)):
+            for xi, yi in zip(*self._transform_finite(x, y)):
                 start, end = sorted([origin, xi])
-                self._canvas[round(yi), round(start) : round(end) + 1] = marker
+                self._draw_marker(
+                    (round(yi), slice(round(start), round(end) + 1)), marker, color
+                )
 
         self._plots.append(partial(draw_hbar, x=x, y=y, marker=marker))
 
+    def hist(
+        self,
+        data: Iterable,
+        bins: Union[int, str, Iterable] = "auto",
+        range: Optional[Tuple[float, float]] = None,
+        density: bool = False,
+        cumulative: bool = False,
+        marker: str = "█",
+        color: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> None:
+        """
+        Adds histogram.
+
+        Args:
+            data: Numerical data to compute the histogram of. Non-finite values (NaN, inf) are ignored.
+            bins: Number of bins, bin edges, or the name of a method to compute the bin edges with (see `np.histogram`).
+                  With a method, the number of bins is limited to the figure width.
+            range: Lower and upper range of the bins. Defaults to the range of the data.
+            density: If True, the histogram is normalized so its integral is 1.
+            cumulative: If True, each bin also counts all bins before it.
+            marker: Marker used to draw bars. Set to `"braille"` to use braille characters.
+            color: Color of marker. Supported values are `"grey"`, `"red"`, `"green"`, `"yellow"`, `"blue"`, `"magenta"`, `"cyan"`, and `"white"`.
+            label: Label to use for legend.
+        """
+        data = Column(data)
+        if not data.is_numerical:
+            raise ValueError("Histogram data must be numerical")
+        if not data.count:
+            raise ValueError("No finite values to plot")
+        values = data.values
+        if data.count < len(data):
+            values = values[np.isfinite(values)]
+        counts, edges = utils._histogram(
+            values,
+            bins,
+            range or (data.min, data.max),  # known already, saves a pass over the data
+            density,
+            cumulative,
+            max_bins=self.width,
+        )
+        # bin i spans edges i to i+1, the extra count makes sure 0 is on the y axis
+        x, y, marker, color, label = self._prep(
+            edges, np.append(counts, 0), marker, color, label
+        )
+
+        def draw_hist(x, y, marker):
+            marker = marker.replace("⠄", "⡇")  # in case of braille
+            if all_numerical(self._y):
+                origin = self._yscale.transform(min(self._ytick_values, key=abs))
+            else:
+                origin = self._yscale.transform(self._ytick_values[0])
+            edges = np.rint(self._transform(self._xscale, x)).astype(int)
+            first = edges[0]
+            last = max(edges[-1], first + 1)
+            # fill each column up to the highest bin starting in it, or the bin before it
+            counts = np.full(last - first, -np.inf)
+            np.maximum.at(
+                counts, edges[:-1].clip(first, last - 1) - first, y.values[:-1]
+            )
+            has_bin = np.isfinite(counts)
+            counts = counts[
+                np.maximum.accumulate(np.where(has_bin, np.arange(len(counts)), 0))
+            ]
+            cols = np.flatnonzero(counts) + first
+            tops = np.rint(self._yscale.transform(counts[cols - first])).astype(int)
+            origin = round(origin)
+            self._draw_marker(
+                utils._column_fill(
+                    cols, np.minimum(tops, origin), np.maximum(tops, origin)
+                ),
+                marker,
+                color,
+            )
+
+        self._plots.append(partial(draw_hist, x=x, y=y, marker=marker))
+
+    def density(
+        self,
+        x: Optional[Iterable] = None,
+        y: Optional[Iterable] = None,
+        cmap: str = "block",
+        log: bool = False,
+        color: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> None:
+        """
+        Adds density plot: a scatter plot for (very) many points, where each character is shaded by the number of points that fall in it.
+
+        Args:
+            x: x data. If `y` is not provided, `x` is assumed to be y data.
+            y: y data.
+            cmap: Colormap used to shade characters. Currently supported cmaps are `"ascii"` and `"block"`.
+            log: If True, shade by the logarithm of the number of points, which brings out sparse regions next to dense ones.
+            color: Color of characters. Supported values are `"grey"`, `"red"`, `"green"`, `"yellow"`, `"blue"`, `"magenta"`, `"cyan"`, and `"white"`.
+            label: Label to use for legend.
+        """
+        cmap = "ascii" if self.ascii_only else cmap
+        x, y, marker, color, label = self._prep(x, y, COLORMAPS[cmap][-1], color, label)
+
+        def draw_density(x, y):
+            xs, ys = self._transform_finite(x, y)
+            rows, cols = self._cell_index(
+                np.round(ys).astype(np.int64), np.round(xs).astype(np.int64)
+            )
+            height, width = self._canvas.shape
+            counts = np.bincount(rows * width + cols, minlength=height * width)
+            drawn = np.nonzero(counts.reshape(height, width))
+            cells = shade(counts.reshape(height, width)[drawn], log=log, cmap=cmap)
+            self._record(self._put_cells, drawn, cells.view(np.uint32), color)
+
+        self._plots.append(partial(draw_density, x=x, y=y))
+
     def text(self, x, y, text: str, color: Optional[str] = None) -> None:
         """
         Adds text.
@@ -422,18 +704,17 @@ class Figure:
             text: Text to draw.
             color: Color of text. Supported values are `"grey"`, `"red"`, `"green"`, `"yellow"`, `"blue"`, `"magenta"`, `"cyan"`, and `"white"`.
         """
-        if color and not self.ascii_only:
-            text = colored(text, color)
+        color = 0 if self.ascii_only else color_index(color)
 
         def draw_text(x, y, text):
-            x0 = round(self._xscale.transform(x[0]))
-            y0 = round(self._yscale.transform(y[0]))
+            x0 = round(self._xscale.transform(x.values[0]))
+            y0 = round(self._yscale.transform(y.values[0]))
             for i, char in enumerate(text):
                 if x0 + i >= self.width:
                     break
-                self._canvas[y0, x0 + i] = char
+                self._draw_marker((y0, x0 + i), char, color)
 
-        self._plots.append(partial(draw_text, x=[x], y=[y], text=text))
+        self._plots.append(partial(draw_text, x=Column([x]), y=Column([y]), text=text))
 
     def image(
         self,
@@ -441,12 +722,17 @@ class Figure:
         vmin: Optional[float] = None,
         vmax: Optional[float] = None,
         cmap: str = "block",
+        interpolation: str = "nearest",
     ) -> None:
         """
         Adds image.
 
         Note that this sets the Y axis direction to point down, unless `y_axis_direction` is set otherwise in Figure init.
 
+        Large images, such as `numpy.memmap` arrays that don't fit in memory, are read only as far as needed:
+        with `"nearest"` interpolation only the pixels that are shown are read, and with `"area"` the image is read in chunks.
+        For images of more than 4 million pixels, `vmin` and `vmax` (if not set) are estimated from a regular sample of pixels.
+
         Args:
             image: 2D array.
             vmin: Minimum value covered by the colormap. Lower values are clipped.
@@ -454,7 +740,11 @@ class Figure:
             vmax: Maximum value covered by the colormap. Higher values are clipped.
                   If set to `None`, uses 255 if the `dtype` of image is `numpy.uint8` (usual for pictures), `max(image)` otherwise.
             cmap: Colormap used to map image values to characters. Currently supported cmaps are `"ascii"` and `"block"`.
+            interpolation: How to resize the image to the figure. `"nearest"` uses the nearest pixel, `"area"` averages the pixels covered by each character.
+                           Use `"area"` to avoid aliasing when showing large images.
         """
+        if interpolation not in ("nearest", "area"):
+            raise ValueError(f"Unsupported interpolation: {interpolation}")
         cmap = "ascii" if self.ascii_only else cmap
         # guess correct value range
         # if (image >= 0).all() and (image <= 1).all():  # between 0 and 1 inclusive
@@ -463,9 +753,10 @@ class Figure:
         if image.dtype == np.uint8:  # probably a picture
             vmin = 0 if vmin is None else vmin
             vmax = 255 if vmax is None else vmax
-        else:
-            vmin = image.flatten().min() if vmin is None else vmin
-            vmax = image.flatten().max() if vmax is None else vmax
+        elif vmin is None or vmax is None:
+            min_, max_ = value_range(image)
+            vmin = min_ if vmin is None else vmin
+            vmax = max_ if vmax is None else vmax
 
         if self._y_axis_direction == "auto":
             self._y_axis_direction = "down"
@@ -483,53 +774,175 @@ class Figure:
                 vmin=vmin,
                 vmax=vmax,
                 cmap=cmap,
+                interpolation=interpolation,
             )
             if self._y_axis_direction != "down":
                 drawn = np.flip(drawn, axis=0)
-            self._canvas[ymin : ymax + 1, xmin : xmax + 1] = drawn
+            self._record(
+                self._put_cells,
+                (slice(ymin, ymax + 1), slice(xmin, xmax + 1)),
+                drawn.view(np.uint32),
+            )
 
         self._plots.append(
             partial(
                 draw_image,
-                x=tuple(range(image.shape[1] + 1)),
-                y=tuple(range(image.shape[0] + 1)),
+                x=Column([0, image.shape[1]]),
+                y=Column([0, image.shape[0]]),
             )
         )
         self._clear_scale_cache()
 
+    def _layout_key(self) -> tuple:
+        """Everything besides their own data that determines how plots are drawn."""
+        return (
+            tuple(self._xtick_values),
+            tuple(self._ytick_values),
+            self._yax_width,
+            self._xax_height(),
+            self.width,
+            self.height,
+            bool(self.title),
+            self._y_axis_direction,
+            self.ascii_only,
+        )
+
+    def _draw_plot(self, plot: Callable, layout: tuple) -> bool:
+        """
+        Draws a plot, or replays its drawing operations if neither its data nor the layout changed since the last render.
+        Only plots of live data are replayed, since other data can be changed in place without a way to tell.
+        Returns whether the drawing operations were replayed.
+        """
+        key = (layout, plot.keywords["x"].version, plot.keywords["y"].version)
+        self._ops = []
+        if None in key[1:]:
+            plot()
+            return False
+        cached_key, ops = self._rendered.get(plot, (None, None))
+        if key == cached_key:
+            for func, args in ops:
+                func(*args)
+            return True
+        plot()
+        self._rendered[plot] = (key, self._ops)
+        return False
+
+    def _sync(self) -> None:
+        """
+        Picks up changes in live data. Live columns can be shared with other figures, which may have synced them already,
+        so this compares the versions of the data to those the scales were last fitted to.
+        """
+        columns = self._x + self._y
+        for column in columns:
+            column.sync()
+        versions = [column.version for column in columns]
+        if versions != self._fitted_versions:
+            self._clear_scale_cache()
+            self._fitted_versions = versions
+
     def _draw(self) -> None:
         if not self._plots:
             raise ValueError("No plots to draw.")
-
-        # 8 (ANSI escape char) + 1 (marker) + 8 (ANSI escape char) = 17
-        self._canvas = np.empty((self.height, self.width), dtype="U17")
-        self._canvas[:] = " "
+        self._stats = RenderStats() if self._instrumented else None
+        with self._stage("sync"):
+            self._sync()
 
         try:
-            if self.title:
-                title = self.title[: self.width]  # make sure it fits
-                self._center_draw(title, self._canvas[0, :])
-
-            self._draw_x_axis()
-            self._draw_y_axis()
-
+            with self._stage("ticks"):
+                layout = self._layout_key()
+            with self._stage("scales"):
+                # fit the scales up front rather than while drawing, so they're timed on their own
+                self._xscale, self._yscale
+            with self._stage("axes"):
+                self._draw_chrome(layout)
             for plot in self._plots:
-                plot()
+                if self._stats is None:
+                    self._draw_plot(plot, layout)
+                    continue
+                kind = plot.func.__name__[len("draw_") :]
+                with self._stats.stage("plot", kind, len(plot.keywords["x"])) as stage:
+                    stage.replayed = self._draw_plot(plot, layout)
             if self._labels:
-                self._draw_legend()
+                with self._stage("legend"):
+                    self._draw_legend()
         except IndexError:
             raise IndexError("Drawing out of bounds. Try increasing the figure size.")
 
-        if self.ascii_only:
-            for old, new in ASCII_FALLBACK.items():
-                self._canvas = np.char.replace(self._canvas, old, new)
+    def _draw_chrome(self, layout: tuple) -> None:
+        """Starts the canvas with the title and axes, which are only drawn again if the layout or labels changed."""
+        shape = (self.height, self.width)
+        if self._canvas is None or self._canvas.shape != shape:
+            # unicode codepoint and color index of each character
+            self._canvas = np.empty(shape, dtype=np.uint32)
+            self._colors = np.empty(shape, dtype=np.uint8)
+        self._colors.fill(0)
+
+        key = (layout, self.title, self._xlabel, self._ylabel)
+        cached_key, chrome = self._chrome
+        if key == cached_key:
+            np.copyto(self._canvas, chrome)
+            return
+        self._canvas.fill(ord(" "))
+        if self.title:
+            title = self.title[: self.width]  # make sure it fits
+            self._center_draw(title, self._canvas[0, :])
+        self._draw_x_axis()
+        self._draw_y_axis()
+        self._chrome = (key, self._canvas.copy())
+
+    def _stage(self, name: str):
+        """Context manager that times a stage of rendering, if collecting render stats."""
+        if self._stats is None:
+            return _NO_STAGE
+        return self._stats.stage(name)
+
+    def _publish_stats(self) -> None:
+        """Makes the stats of the finished render available, and passes them to the hook."""
+        stats, self._stats = self._stats, None
+        if stats is None:
+            return
+        self.render_stats = stats
+        if self._stats_hook is not None:
+            self._stats_hook(stats)
+
+    def instrument(
+        self, enabled: bool = True, hook: Optional[Callable[[RenderStats], None]] = None
+    ) -> None:
+        """
+        Turns on measuring where the time goes when rendering the figure.
+
+        After each render (`str(fig)`, `fig.show()`, and so on), `fig.render_stats` holds a `RenderStats` with the wall time
+        of each stage (picking up live data, computing ticks, fitting scales, drawing the axes, placing the x tick labels,
+        each plot, the legend, serializing to text and the ascii fallback), the number of points of each plot,
+        and the number of bytes of output.
+        When turned off (the default), no stats are collected, which costs next to nothing.
+
+        Args:
+            enabled: Set to `False` to turn it off again.
+            hook: Function called with the `RenderStats` after each render, e.g. to export them to a metrics system.
+        """
+        self._instrumented = enabled
+        self._stats_hook = hook if enabled else None
+        if not enabled:
+            self.render_stats = None
 
     def clear(self) -> None:
         """Clears previously added plots."""
         self._plots = []
         self._labels = []
+        self._rendered = {}
         self._clear_scale_cache()
 
+    def _share_ticks(
+        self, xticks: Optional[list] = None, yticks: Optional[list] = None
+    ) -> None:
+        """Uses tick values computed over several figures, so their scales match."""
+        shared = {"_xtick_values": xticks, "_ytick_values": yticks}
+        shared = {name: ticks for name, ticks in shared.items() if ticks is not None}
+        if any(self.__dict__.get(name) != ticks for name, ticks in shared.items()):
+            self._clear_scale_cache()
+            self.__dict__.update(shared)
+
     def _clear_scale_cache(self) -> None:
         # clear cached values if cached, otherwise do nothing
         self.__dict__.pop("_xscale", None)
@@ -540,12 +953,88 @@ class Figure:
 
     def __str__(self) -> str:
         self._draw()
-        return "\n".join(["".join(row) for row in self._canvas.tolist()])
+        return "\n".join(self._lines())
 
-    def show(self) -> None:
+    def iter_lines(self) -> Iterator[str]:
+        """
+        Yields the lines of the figure one at a time (without newline characters).
+        Unlike `str(fig)`, this doesn't build the whole figure as a single string, which saves memory for very large figures.
+        """
+        self._draw()
+        yield from self._lines()
+
+    def _lines(self) -> Iterator[str]:
+        if self._stats is None:
+            for line in render_rows(self._canvas, self._colors):
+                yield self._ascii_fallback(line)
+            return
+
+        # time each line separately, so the time spent by the consumer of the lines isn't counted
+        serialize = self._stats.add("serialize")
+        fallback = self._stats.add("ascii") if self.ascii_only else serialize
+        rows = render_rows(self._canvas, self._colors)
+        while True:
+            start = perf_counter()
+            line = next(rows, None)
+            serialized = perf_counter()
+            if line is None:
+                break
+            line = self._ascii_fallback(line)
+            serialize.seconds += serialized - start
+            fallback.seconds += perf_counter() - serialized
+            serialize.bytes += len(line.encode("utf-8"))
+            yield line
+        self._publish_stats()
+
+    def _ascii_fallback(self, output: str) -> str:
+        """Replaces unicode characters in the output with ascii characters, if the figure is ascii only."""
+        return output.translate(_ASCII_TRANSLATION) if self.ascii_only else output
+
+    def show(
+        self, inplace: bool = False, file: Optional[TextIO] = None, flush: bool = False
+    ) -> None:
         """
         Prints the figure.
 
         Note that to get the figure as a string (to write to a file, for example), you can simply convert it to str type: `str(fig)`
+
+        Args:
+            inplace: Set to `True` when showing the figure repeatedly, e.g. for live data. Instead of printing the whole figure again,
+                     the previously shown figure is updated in place by only redrawing the characters that changed.
+                     The figure is printed in full the first time, and whenever the figure or terminal is resized.
+            file: Text stream to write to, line by line. Defaults to `sys.stdout`.
+            flush: Set to `True` to flush the stream after writing.
         """
-        print(str(self))
+        if file is None:
+            file = sys.stdout
+        if not inplace:
+            for line in self.iter_lines():
+                file.write(line + "\n")
+        else:
+            self._show_inplace(file)
+        if flush:
+            file.flush()
+
+    def _show_inplace(self, file: TextIO) -> None:
+        self._draw()
+        terminal_size = get_terminal_size()
+        previous_frame, previous_terminal_size = self._shown
+        if previous_frame is None or previous_frame[0].shape != self._canvas.shape:
+            file.write("\n".join(self._lines()) + "\n")
+        elif previous_terminal_size != terminal_size:
+            # lines may have wrapped, so start over
+            file.write(CLEAR_SCREEN + "\n".join(self._lines()) + "\n")
+        else:
+            with self._stage("serialize") as stage:
+                output = self._ascii_fallback(frame_diff(previous_frame, self._frame()))
+            if stage is not None:
+                stage.bytes = len(output.encode("utf-8"))
+                self._publish_stats()
+            file.write(output)
+            file.flush()
+        self._shown = (self._frame(copy=True), terminal_size)
+
+    def _frame(self, copy: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        if copy:
+            return self._canvas.copy(), self._colors.copy()
+        return self._canvas, self._colors
@@ -0,0 +1,156 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+import numpy as np
+
+from .columns import Column, all_numerical
+from .figure import _ASCII_TRANSLATION, Figure
+from .terminal import render_rows
+from .utils import terminal_size
+
+
+class Grid:
+    """
+    Lays out several figures ("panels") in a grid of rows and columns, shown together as one figure.
+
+    Panels are regular `Figure`s: plot on them with `grid[row, col].line(...)` and so on.
+
+    Args:
+        rows: Number of rows of panels.
+        cols: Number of columns of panels.
+        width: Width of the whole grid in characters. Defaults to terminal width.
+        height: Height of the whole grid in characters. Defaults to terminal height.
+        sharex: Set to `True` to give all panels the same x axis, fitted to the data of all panels.
+        sharey: Set to `True` to give all panels the same y axis, fitted to the data of all panels.
+        ascii: Set to `True` to only use ascii characters. Defaults to trying to detect if unicode is supported in the terminal.
+        workers: Maximum number of threads used to draw panels concurrently. Set to 1 to draw them one after the other.
+        **kwargs: Passed on to each panel `Figure` (e.g. `legendloc`).
+    """
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        sharex: bool = False,
+        sharey: bool = False,
+        ascii: bool = False,
+        workers: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        if not (
+            isinstance(rows, int) and rows > 0 and isinstance(cols, int) and cols > 0
+        ):
+            raise ValueError("`rows` and `cols` must be positive integers")
+        term_width, term_height = terminal_size()
+        term_height -= 1  # room for prompt
+        self.width = width if width else term_width
+        self.height = height if height else term_height
+        self.sharex = sharex
+        self.sharey = sharey
+        self.workers = workers
+
+        # one blank column between panels
+        self.panel_width = (self.width - (cols - 1)) // cols
+        self.panel_height = self.height // rows
+        self.panels: List[List[Figure]] = [
+            [
+                Figure(
+                    width=self.panel_width,
+                    height=self.panel_height,
+                    ascii=ascii,
+                    **kwargs,
+                )
+                for _ in range(cols)
+            ]
+            for _ in range(rows)
+        ]
+        self.ascii_only = self.panels[0][0].ascii_only
+
+    def __getitem__(self, index: Tuple[int, int]) -> Figure:
+        row, col = index
+        return self.panels[row][col]
+
+    def _used_panels(self) -> List[Figure]:
+        return [panel for row in self.panels for panel in row if panel._plots]
+
+    def _share_ticks(self, panels: List[Figure]) -> None:
+        """Computes tick values over the data of all panels once, and hands them to each panel."""
+        for panel in panels:
+            panel._sync()
+        template = panels[0]
+        xticks = yticks = None
+        if self.sharex:
+            xticks = template._xticks_for(_shared_columns(panels, "x"))
+        if self.sharey:
+            yticks = template._yticks_for(_shared_columns(panels, "y"))
+        for panel in panels:
+            panel._share_ticks(xticks, yticks)
+
+    def _draw(self) -> None:
+        panels = self._used_panels()
+        if not panels:
+            raise ValueError("No plots to draw.")
+        if self.sharex or self.sharey:
+            self._share_ticks(panels)
+
+        if self.workers == 1:
+            for panel in panels:
+                panel._draw()
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(Figure._draw, panels))  # list() to raise exceptions
+
+        self._canvas = np.full((self.height, self.width), ord(" "), dtype=np.uint32)
+        self._colors = np.zeros((self.height, self.width), dtype=np.uint8)
+        for i, row in enumerate(self.panels):
+            for j, panel in enumerate(row):
+                if not panel._plots:
+                    continue
+                top, left = i * self.panel_height, j * (self.panel_width + 1)
+                area = (
+                    slice(top, top + self.panel_height),
+                    slice(left, left + self.panel_width),
+                )
+                self._canvas[area] = panel._canvas
+                self._colors[area] = panel._colors
+
+    def __str__(self) -> str:
+        self._draw()
+        return "\n".join(self._lines())
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yields the lines of the grid one at a time (without newline characters)."""
+        self._draw()
+        yield from self._lines()
+
+    def _lines(self) -> Iterator[str]:
+        for line in render_rows(self._canvas, self._colors):
+            yield line.translate(_ASCII_TRANSLATION) if self.ascii_only else line
+
+    def show(self, file: Optional[TextIO] = None, flush: bool = False) -> None:
+        """
+        Prints the grid.
+
+        Args:
+            file: Text stream to write to, line by line. Defaults to `sys.stdout`.
+            flush: Set to `True` to flush the stream after writing.
+        """
+        if file is None:
+            file = sys.stdout
+        for line in self.iter_lines():
+            file.write(line + "\n")
+        if flush:
+            file.flush()
+
+
+def _shared_columns(panels: List[Figure], axis: str) -> List[Column]:
+    """Returns the columns of all `panels` along `axis`, after checking the panels agree on the kind of axis."""
+    columns = [getattr(panel, f"_{axis}") for panel in panels]
+    if len({all_numerical(panel_columns) for panel_columns in columns}) > 1:
+        raise ValueError(
+            f"Shared {axis} axes must be all numerical or all categorical, not a mix of both"
+        )
+    return [column for panel_columns in columns for column in panel_columns]
@@ -10,20 +10,71 @@ COLORMAPS = {
     "block": np.array(tuple(" ░▒▓█")),
 }
 
+# number of pixels processed at once, so (memory-mapped) images larger than memory can be shown
+CHUNK_SIZE = 2**22
 
-@lru_cache(maxsize=1)
-def _regular_meshgrid(xmin, ymin, xmax, ymax, **kwargs):
-    return np.meshgrid(np.arange(xmin, xmax), np.arange(ymin, ymax), **kwargs)
 
+@lru_cache(maxsize=16)
+def _resize_indices(source_shape: tuple, shape: tuple) -> tuple:
+    """
+    Returns, for each axis, the index of the first source pixel of each target pixel, and the number of source pixels it covers.
+    These only depend on the shapes, so they are cached for when images of the same size are shown repeatedly (e.g. video frames).
+    """
+    indices = []
+    for source_size, size in zip(source_shape, shape):
+        starts = (source_size * np.arange(size + 1) / size).astype(int)
+        # when upscaling, target pixels cover (part of) a single source pixel
+        counts = np.maximum(np.diff(starts), 1)
+        starts = starts[:-1]
+        starts.setflags(write=False)
+        counts.setflags(write=False)
+        indices.append((starts, counts))
+    return tuple(indices)
 
-def resize(image: np.ndarray, shape: tuple) -> np.ndarray:
-    """Nearest neighbor image resizing"""
-    x, y = _regular_meshgrid(0, 0, shape[0], shape[1])
-    x = image.shape[0] * x / shape[0]
-    y = image.shape[1] * y / shape[1]
-    x = x.astype(int)
-    y = y.astype(int)
-    return image[x, y].T
+
+def resize(
+    image: np.ndarray, shape: tuple, interpolation: str = "nearest"
+) -> np.ndarray:
+    """
+    Resizes a 2D image.
+
+    Args:
+        image: 2D array.
+        shape: Shape of the output image.
+        interpolation: `"nearest"` for nearest neighbor sampling, or `"area"` to average the source pixels covered by each output pixel.
+                       Averaging is slower, but avoids aliasing when shrinking large images.
+    """
+    (rows, row_counts), (cols, col_counts) = _resize_indices(image.shape, tuple(shape))
+    if interpolation == "nearest":
+        return image[rows[:, np.newaxis], cols]
+    elif interpolation == "area":
+        summed = np.empty(shape)
+        # sum over blocks of rows, then over blocks of columns, for a limited number of source rows at a time
+        step = max(1, CHUNK_SIZE // (image.shape[1] * int(row_counts.max())))
+        for i in range(0, len(rows), step):
+            chunk_rows = rows[i : i + step]
+            block = image[
+                chunk_rows[0] : chunk_rows[-1] + row_counts[i + len(chunk_rows) - 1]
+            ]
+            block = np.add.reduceat(
+                block, chunk_rows - chunk_rows[0], axis=0, dtype=float
+            )
+            summed[i : i + step] = np.add.reduceat(block, cols, axis=1)
+        return summed / np.multiply.outer(row_counts, col_counts)
+    else:
+        raise ValueError(f"Unsupported interpolation: {interpolation}")
+
+
+def value_range(image: np.ndarray, max_samples: int = CHUNK_SIZE) -> tuple:
+    """
+    Returns the minimum and maximum value of `image`.
+    For images of more than `max_samples` pixels, these are estimated from a regular grid of about `max_samples` pixels,
+    so large (memory-mapped) images don't have to be read in full.
+    """
+    if image.size > max_samples:
+        step = int(np.ceil(np.sqrt(image.size / max_samples)))
+        image = image[::step, ::step]
+    return image.min().item(), image.max().item()
 
 
 def img2ascii(
@@ -33,11 +84,22 @@ def img2ascii(
     vmin: float,
     vmax: float,
     cmap: str = "block",
+    interpolation: str = "nearest",
 ) -> np.ndarray:
     if len(image.shape) != 2:
         raise ValueError("Invalid shape for grayscale image")
-    image = resize(image, (height, width))
+    image = resize(image, (height, width), interpolation)
     scale = LinearScale()
     scale.fit([vmin, vmax], target_min=0, target_max=len(COLORMAPS[cmap]) - 1)
     cmap_idx = scale.transform(image.astype(float).clip(vmin, vmax)).round().astype(int)
     return COLORMAPS[cmap][cmap_idx]
+
+
+def shade(counts: np.ndarray, log: bool = False, cmap: str = "block") -> np.ndarray:
+    """
+    Maps nonzero counts (e.g. number of points per character) to characters of a colormap, the highest count getting the darkest character.
+    Any nonzero count gets at least the lightest visible character.
+    """
+    values = np.log1p(counts) if log else counts.astype(float)
+    levels = np.ceil(values / values.max() * (len(COLORMAPS[cmap]) - 1))
+    return COLORMAPS[cmap][levels.astype(int)]
@@ -0,0 +1,122 @@
+from typing import Iterable, Optional
+
+import numpy as np
+
+from .columns import Column
+
+
+class LiveSeries:
+    """
+    Fixed-capacity ring buffer of (x, y) samples, for plotting data that keeps coming in.
+
+    Pass it to a plot method of a `Figure` (e.g. `fig.line(series)`), then keep appending samples and showing the figure.
+    Only plots whose data changed are drawn again.
+
+    Args:
+        capacity: Maximum number of samples to keep. Older samples are dropped.
+        window: If set, only samples with an x value within `window` of the latest x value are kept (e.g. the last 60 seconds).
+                This requires x values to be increasing.
+    """
+
+    def __init__(self, capacity: int, window: Optional[float] = None) -> None:
+        if not (isinstance(capacity, int) and capacity > 0):
+            raise ValueError("`capacity` must be a positive integer")
+        self.capacity = capacity
+        self.window = window
+        # twice the capacity, so the samples are always contiguous in memory and can be viewed without copying
+        self._buffer = np.empty((2, 2 * capacity), dtype=float)
+        self._start = 0
+        self._end = 0
+        self._appended = 0  # total number of samples appended, used as default x value
+        self.version = 0
+        self._x = _LiveColumn(self, axis=0)
+        self._y = _LiveColumn(self, axis=1)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def x(self) -> Column:
+        self._x.sync()
+        return self._x
+
+    @property
+    def y(self) -> Column:
+        self._y.sync()
+        return self._y
+
+    def append(self, x: float, y: Optional[float] = None) -> None:
+        """
+        Appends a sample.
+
+        Args:
+            x: x value. If `y` is not provided, `x` is assumed to be the y value and x is the sample number.
+            y: y value.
+        """
+        if y is None:
+            self.extend([x])
+        else:
+            self.extend([x], [y])
+
+    def extend(self, x: Iterable, y: Optional[Iterable] = None) -> None:
+        """
+        Appends multiple samples.
+
+        Args:
+            x: x values. If `y` is not provided, `x` is assumed to be y values and x is the sample number.
+            y: y values.
+        """
+        if y is None:
+            y = np.asarray(x, dtype=float)
+            x = np.arange(self._appended, self._appended + len(y), dtype=float)
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if not len(x) == len(y):
+            raise ValueError("`x` and `y` must have the same length")
+        self._appended += len(y)
+
+        n = min(len(y), self.capacity)
+        keep = min(len(self), self.capacity - n)
+        if self._end + n > self._buffer.shape[1]:
+            # move the samples to keep to the front of the buffer
+            self._buffer[:, :keep] = self._buffer[:, self._end - keep : self._end]
+            self._end = keep
+        self._start = self._end - keep
+        self._buffer[0, self._end : self._end + n] = x[len(x) - n :]
+        self._buffer[1, self._end : self._end + n] = y[len(y) - n :]
+        self._end += n
+
+        if self.window is not None and len(self):
+            latest = self._buffer[0, self._end - 1]
+            self._start += int(
+                np.searchsorted(
+                    self._buffer[0, self._start : self._end], latest - self.window
+                )
+            )
+        self.version += 1
+
+    def clear(self) -> None:
+        """Drops all samples."""
+        self._start = self._end = 0
+        self.version += 1
+
+    def _view(self, axis: int) -> np.ndarray:
+        return self._buffer[axis, self._start : self._end]
+
+
+class _LiveColumn(Column):
+    """Column viewing one axis of a `LiveSeries`. It is updated when the series changes."""
+
+    def __init__(self, series: LiveSeries, axis: int) -> None:
+        self._series = series
+        self._axis = axis
+        super().__init__(series._view(axis))
+        self.version = series.version
+
+    def sync(self) -> bool:
+        if self.version == self._series.version:
+            return False
+        self.values = self._series._view(self._axis)
+        self._summarize()
+        self.version = self._series.version
+        return True
@@ -1,51 +1,111 @@
-from typing import Iterable
+from numbers import Number
+from typing import Iterable, Optional
 
 import numpy as np
 
 
 class Scale:
-    """Base `Scale` class."""
+    """
+    Base `Scale` class.
+
+    Scales map values to positions. Scalars are transformed to scalars, lists to lists, and NumPy arrays to NumPy arrays.
+    Transforming NumPy arrays is vectorized, and optionally takes the `dtype` of the output (e.g. `np.float32` to save memory)
+    and an `out` array to write the output to (to avoid allocating a new array).
+    """
 
     def __init__(self):
         pass
 
-    def transform(self, values):
+    def transform(self, values, dtype=None, out: Optional[np.ndarray] = None):
+        if isinstance(values, (str, Number)):
+            return self._transform_scalar(values)
+        return self._apply(self._transform, values, dtype, out)
+
+    def inverse(self, values, dtype=None, out: Optional[np.ndarray] = None):
+        """Inverse of `transform()`."""
+        if isinstance(values, (str, Number)):
+            return self._inverse_scalar(values)
+        return self._apply(self._inverse, values, dtype, out)
+
+    def _apply(self, func, values, dtype, out):
         if isinstance(values, np.ndarray):
-            if isinstance(self, CategoricalScale):
-                return np.vectorize(self._transform)(values)
-            else:
-                return self._transform(values)
-        elif isinstance(values, str):
-            return self._transform(values)
-        elif isinstance(values, Iterable):
-            return [self._transform(v) for v in values]
+            return func(values, dtype=dtype, out=out)
+        elif isinstance(values, (str, Number)) or not isinstance(values, Iterable):
+            return func(np.asarray([values]))[0].item()
         else:
-            return self._transform(values)
+            return func(np.asarray(list(values))).tolist()
 
-    def _transform(self, value):
+    def _transform(self, values: np.ndarray, dtype=None, out=None) -> np.ndarray:
         raise NotImplementedError
 
+    def _inverse(self, values: np.ndarray, dtype=None, out=None) -> np.ndarray:
+        raise NotImplementedError
+
+    # scalars are common (e.g. text, ticks and single points), and too small to be worth the overhead of NumPy,
+    # so subclasses can transform them in pure Python
+    def _transform_scalar(self, value):
+        return self._transform(np.asarray([value]))[0].item()
+
+    def _inverse_scalar(self, value):
+        return self._inverse(np.asarray([value]))[0].item()
+
 
 class LinearScale(Scale):
     """Transform numerical values linearly."""
 
     def __init__(self):
         super().__init__()
+        self.original_min = 0
+        self.original_range = 1
+        self.target_min = 0
+        self.target_range = 1
 
     def fit(self, values, target_min, target_max):
         """Fit transform to linearly scale `values` to `target_min` and `target_max`."""
-        original_min = min(tuple(values))
-        original_max = max(tuple(values))
+        values = np.asarray(values)
+        original_min = values.min().item()
+        original_max = values.max().item()
         if original_min == original_max:
             original_min -= 1
             original_max += 1
-        original_range = original_max - original_min
-        target_range = target_max - target_min
-
-        def _transform(value):
-            return target_range * (value - original_min) / original_range + target_min
-
-        self._transform = _transform
+        self.original_min = original_min
+        self.original_range = original_max - original_min
+        self.target_min = target_min
+        self.target_range = target_max - target_min
+
+    def _transform(self, values, dtype=None, out=None):
+        # same order of operations as `target_range * (value - original_min) / original_range + target_min`,
+        # but in place, so no temporary arrays are allocated
+        if dtype is None and out is None:
+            dtype = float
+        out = np.subtract(values, self.original_min, dtype=dtype, out=out)
+        np.multiply(self.target_range, out, out=out)
+        np.divide(out, self.original_range, out=out)
+        return np.add(out, self.target_min, out=out)
+
+    def _inverse(self, values, dtype=None, out=None):
+        if dtype is None and out is None:
+            dtype = float
+        out = np.subtract(values, self.target_min, dtype=dtype, out=out)
+        np.multiply(self.original_range, out, out=out)
+        np.divide(out, self.target_range, out=out)
+        return np.add(out, self.original_min, out=out)
+
+    def _transform_scalar(self, value) -> float:
+        # same operations as `_transform()`, on Python floats
+        return (
+            self.target_range * (float(value) - self.original_min) / self.original_range
+            + self.target_min
+        )
+
+    def _inverse_scalar(self, value) -> float:
+        if not self.target_range:
+            # NumPy gives inf or nan where Python raises ZeroDivisionError
+            return super()._inverse_scalar(value)
+        return (
+            self.original_range * (float(value) - self.target_min) / self.target_range
+            + self.original_min
+        )
 
 
 class CategoricalScale(Scale):
@@ -53,18 +113,62 @@ class CategoricalScale(Scale):
 
     def __init__(self):
         super().__init__()
+        self.categories = np.array([], dtype=str)
+        self._scale = LinearScale()
+        # index of each category, built on first use by `_transform_scalar()`
+        self._index: Optional[dict] = None
 
     def fit(self, values, target_min=0, target_max=None):
         """Fit transform to map `values` to numbers evenly spaced from `target_min` to `target_max`."""
-        values = [str(v) for v in values]
-        idxmap = {value: i for i, value in enumerate(sorted(set(values)))}
+        self.categories = np.unique(np.asarray(values).astype(str))
         if target_min == 0 and target_max is None:
-            target_max = len(idxmap) - 1
-        scale = LinearScale()
-        scale.fit(list(idxmap.values()), target_min, target_max)
-        idxmap = {value: scale.transform([i])[0] for value, i in idxmap.items()}
-
-        def _transform(value):
-            return idxmap[str(value)]
-
-        self._transform = _transform
+            target_max = len(self.categories) - 1
+        self._scale.fit(np.arange(len(self.categories)), target_min, target_max)
+        self._index = None
+
+    def codes(self, values: np.ndarray) -> np.ndarray:
+        """Returns the index of each value in the sorted categories."""
+        values = values.astype(str)
+        codes = np.searchsorted(self.categories, values)
+        if not np.array_equal(
+            self.categories[codes.clip(max=len(self.categories) - 1)], values
+        ):
+            raise KeyError("Value not in fitted categories")
+        return codes
+
+    def transform_codes(
+        self,
+        categories: np.ndarray,
+        codes: np.ndarray,
+        dtype=None,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Transforms factorized values, given as `categories` and the index of each value into those (see `Column.factorize()`).
+        Only the categories are looked up, after which each value is a single array lookup.
+        """
+        positions = self._transform(np.asarray(categories), dtype=dtype)
+        return np.take(positions, codes, out=out)
+
+    def _transform(self, values, dtype=None, out=None):
+        return self._scale.transform(self.codes(values), dtype=dtype, out=out)
+
+    def _inverse(self, values, dtype=None, out=None):
+        codes = np.rint(self._scale.inverse(values)).astype(int)
+        return self.categories[codes.clip(0, len(self.categories) - 1)]
+
+    def _transform_scalar(self, value) -> float:
+        if self._index is None:
+            self._index = {
+                category: code for code, category in enumerate(self.categories.tolist())
+            }
+        try:
+            code = self._index[str(value)]
+        except KeyError:
+            raise KeyError("Value not in fitted categories") from None
+        return self._scale._transform_scalar(code)
+
+    def _inverse_scalar(self, value) -> str:
+        # `round()` rounds halves to even, like `np.rint()`
+        code = round(self._scale._inverse_scalar(value))
+        return str(self.categories[min(max(code, 0), len(self.categories) - 1)])
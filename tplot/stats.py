@@ -0,0 +1,111 @@
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Iterator, List
+
+
+class Stage:
+    """
+    Measurements of one stage of rendering a figure.
+
+    Attributes:
+        name: Name of the stage: `"sync"`, `"ticks"`, `"scales"`, `"axes"`, `"xticklabels"`, `"plot"`, `"legend"`,
+              `"serialize"` or `"ascii"`.
+        seconds: Wall time spent in the stage itself, not counting stages nested in it
+                 (e.g. `"axes"` does not include `"xticklabels"`).
+        points: Number of data points processed (for plots).
+        bytes: Number of bytes of output (UTF-8 encoded, without newlines) emitted (for `"serialize"`).
+        plot: For plots, the kind of plot (e.g. `"line"`).
+        replayed: For plots, whether the drawing operations of the previous render were replayed,
+                  because neither the data nor the layout changed.
+    """
+
+    def __init__(self, name: str, plot: str = "", points: int = 0) -> None:
+        self.name = name
+        self.plot = plot
+        self.seconds = 0.0
+        self.points = points
+        self.bytes = 0
+        self.replayed = False
+
+    def as_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "plot": self.plot,
+            "seconds": self.seconds,
+            "points": self.points,
+            "bytes": self.bytes,
+            "replayed": self.replayed,
+        }
+
+    def __repr__(self) -> str:
+        plot = f", plot={self.plot!r}" if self.plot else ""
+        return (
+            f"Stage({self.name!r}{plot}, seconds={self.seconds:.6f}, points={self.points}, bytes={self.bytes}"
+            f"{', replayed=True' if self.replayed else ''})"
+        )
+
+
+class RenderStats:
+    """
+    Where the time went during one render of a figure, stage by stage and plot by plot.
+
+    Collected when enabled with `Figure.instrument()`, and available as `Figure.render_stats` after each render.
+
+    Attributes:
+        stages: The stages in the order they ran, with one `"plot"` stage per plot.
+    """
+
+    def __init__(self) -> None:
+        self.stages: List[Stage] = []
+        self._running: List[Stage] = []
+
+    @contextmanager
+    def stage(self, name: str, plot: str = "", points: int = 0) -> Iterator[Stage]:
+        """Times the code in the `with` block as a stage, excluding the time of stages nested in it."""
+        stage = Stage(name, plot, points)
+        self.stages.append(stage)
+        self._running.append(stage)
+        start = perf_counter()
+        try:
+            yield stage
+        finally:
+            seconds = perf_counter() - start
+            self._running.pop()
+            stage.seconds += seconds
+            if self._running:
+                self._running[-1].seconds -= seconds
+
+    def add(self, name: str) -> Stage:
+        """Adds a stage whose measurements are filled in by the caller."""
+        stage = Stage(name)
+        self.stages.append(stage)
+        return stage
+
+    @property
+    def seconds(self) -> float:
+        """Total wall time of all stages."""
+        return sum(stage.seconds for stage in self.stages)
+
+    @property
+    def bytes(self) -> int:
+        """Total number of bytes of output."""
+        return sum(stage.bytes for stage in self.stages)
+
+    def by_name(self) -> dict:
+        """Total seconds per stage name."""
+        totals: dict = {}
+        for stage in self.stages:
+            totals[stage.name] = totals.get(stage.name, 0.0) + stage.seconds
+        return totals
+
+    def as_dict(self) -> dict:
+        """The stats as plain Python types, e.g. to export as JSON."""
+        return {
+            "seconds": self.seconds,
+            "bytes": self.bytes,
+            "stages": [stage.as_dict() for stage in self.stages],
+        }
+
+    def __repr__(self) -> str:
+        stages = "".join(f"\n    {stage!r}," for stage in self.stages)
+        return f"RenderStats(seconds={self.seconds:.6f}, stages=[{stages}\n])"
@@ -0,0 +1,109 @@
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+from termcolor import COLORS as TERMCOLORS
+from termcolor import colored
+
+CSI = "\x1b["
+CLEAR_SCREEN = CSI + "2J" + CSI + "H"
+
+# colors by index in the color plane of a canvas, 0 meaning no color
+COLORS = (None,) + tuple(TERMCOLORS)
+
+
+@lru_cache(maxsize=1)
+def init_colors() -> None:
+    """
+    Initializes colorama, which makes ANSI colors work on Windows (and strips them when output isn't a terminal).
+    This wraps `sys.stdout`, so it's done once, when the first figure is created, rather than on import.
+    """
+    from colorama import init
+
+    init()
+
+
+def color_index(color: Optional[str]) -> int:
+    """Returns the index of `color` in `COLORS`."""
+    if not color:
+        return 0
+    if color not in COLORS:
+        raise ValueError(f"Unsupported color: {color}")
+    return COLORS.index(color)
+
+
+def _color_codes() -> list:
+    """ANSI escape sequences before and after a character for each color (empty if colors are disabled)."""
+    return [colored("\0", color).split("\0") if color else ["", ""] for color in COLORS]
+
+
+def render_cells(codepoints: np.ndarray, colors: np.ndarray) -> str:
+    """Composes a row (or part of a row) of canvas cells into a string, wrapping runs of colored cells in ANSI escape sequences."""
+    text = np.ascontiguousarray(codepoints, dtype="<u4").tobytes().decode("utf-32-le")
+    if not colors.any():
+        return text
+    codes = _color_codes()
+    # split into runs of cells of the same color
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(colors)) + 1))
+    ends = np.append(starts[1:], len(colors))
+    out = []
+    for start, end, color in zip(
+        starts.tolist(), ends.tolist(), colors[starts].tolist()
+    ):
+        prefix, suffix = codes[color]
+        out.append(prefix + text[start:end] + suffix)
+    return "".join(out)
+
+
+def render_rows(codepoints: np.ndarray, colors: np.ndarray) -> Iterator[str]:
+    """Yields the rows of a canvas, given as a plane of unicode codepoints and a plane of color indices."""
+    for row_codepoints, row_colors in zip(codepoints, colors):
+        yield render_cells(row_codepoints, row_colors)
+
+
+def _cursor_up(n: int) -> str:
+    return f"{CSI}{n}A" if n > 0 else ""
+
+
+def _cursor_down(n: int) -> str:
+    return f"{CSI}{n}B" if n > 0 else ""
+
+
+def _cursor_forward(n: int) -> str:
+    return f"{CSI}{n}C" if n > 0 else ""
+
+
+def frame_diff(
+    previous: Tuple[np.ndarray, np.ndarray], current: Tuple[np.ndarray, np.ndarray]
+) -> str:
+    """
+    Returns the output that turns the previously printed frame into the current frame, by moving the cursor
+    to each run of changed characters and only printing those.
+    Frames are (codepoints, colors) planes of canvases of the same shape.
+    The cursor is assumed to be at the start of the line below the previous frame, and is left at the start of the line below the current frame.
+    Only relative cursor movements are used, which are also supported by colorama on Windows.
+    """
+    codepoints, colors = current
+    height = codepoints.shape[0]
+    rows, cols = np.nonzero((previous[0] != codepoints) | (previous[1] != colors))
+    if not len(rows):
+        return ""
+    # split changed cells into runs of consecutive columns on the same row
+    breaks = np.flatnonzero((np.diff(rows) != 0) | (np.diff(cols) != 1)) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [len(rows)]))
+
+    out = ["\r", _cursor_up(height)]
+    row, col = 0, 0
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        run_row, run_col = int(rows[start]), int(cols[start])
+        if run_row != row:
+            out.append("\r" + _cursor_down(run_row - row))
+            row, col = run_row, 0
+        out.append(_cursor_forward(run_col - col))
+        col = run_col + end - start
+        out.append(
+            render_cells(codepoints[run_row, run_col:col], colors[run_row, run_col:col])
+        )
+    out.append("\r" + _cursor_down(height - row))
+    return "".join(out)
@@ -1,23 +1,38 @@
 import math
 import sys
 from bisect import bisect
-from numbers import Number
-from typing import Generator, Iterable, List
-from warnings import warn
+from functools import lru_cache
+from os import terminal_size as TerminalSize
+from shutil import get_terminal_size
+from typing import Generator, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 
 def unicode_supported(test_str: str = "─│┤┬┌┐└┘█•·⣿") -> bool:
-    """Tries to determine if unicode is supported by encoding a test string containing unicode characters."""
+    """
+    Tries to determine if unicode is supported by encoding a test string containing unicode characters.
+    The result is cached for each encoding of `sys.stdout`.
+    """
+    return _encodable(test_str, sys.stdout.encoding)
+
+
+@lru_cache(maxsize=16)
+def _encodable(string: str, encoding: str) -> bool:
     try:
-        test_str.encode(sys.stdout.encoding)
+        string.encode(encoding)
         return True
     except UnicodeEncodeError:
         return False
 
 
-def _is_numerical(data: Iterable[Number]) -> bool:
-    """Returns True if all values in given iterable are numbers."""
-    return all([isinstance(value, Number) for value in data])
+@lru_cache(maxsize=1)
+def terminal_size() -> TerminalSize:
+    """
+    Size of the terminal, falling back to 80 by 24 characters.
+    This is probed once per process, for the default size of figures. Showing a figure in place checks the actual size every time.
+    """
+    return get_terminal_size(fallback=(80, 24))
 
 
 def _plot_line_segment(
@@ -50,6 +65,101 @@ def _plot_line_segment(
         D += 2 * dy
 
 
+def _plot_line_segments(
+    x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized version of `_plot_line_segment` for many segments at once.
+    Returns arrays of x and y coordinates of all points of all segments, in the same order as the Bresenham algorithm yields them.
+
+    The Bresenham decision variable has a closed form: at step `k` along the major axis,
+    the minor axis has moved `ceil((2 * k * dy - dx) / (2 * dx))` steps.
+    """
+    x0, y0, x1, y1 = (np.asarray(a, dtype=np.int64) for a in (x0, y0, x1, y1))
+    # ensure slope is not >1
+    swapped = np.abs(y1 - y0) > np.abs(x1 - x0)
+    a0, b0 = np.where(swapped, y0, x0), np.where(swapped, x0, y0)
+    a1, b1 = np.where(swapped, y1, x1), np.where(swapped, x1, y1)
+    # always draw left to right
+    flipped = a0 > a1
+    a0, a1 = np.where(flipped, a1, a0), np.where(flipped, a0, a1)
+    b0, b1 = np.where(flipped, b1, b0), np.where(flipped, b0, b1)
+    da = a1 - a0
+    db = b1 - b0
+    step = np.where(db < 0, -1, 1)
+    db = np.abs(db)
+
+    counts = da + 1
+    segment = np.repeat(np.arange(len(counts)), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    da = da[segment]
+    m = -((da - 2 * db[segment] * k) // np.maximum(2 * da, 1))
+    a = a0[segment] + k
+    b = b0[segment] + step[segment] * m
+    swapped = swapped[segment]
+    return np.where(swapped, b, a), np.where(swapped, a, b)
+
+
+def _m4_downsample(
+    x: np.ndarray, y: np.ndarray, parts: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Returns indices of the first, last, minimum and maximum point of each run of consecutive points
+    with the same (pixel) x coordinate, in order. Consecutive points with the same x coordinate are
+    connected by vertical line segments, so drawing only these points results in the exact same line.
+    If the line is broken into `parts` (the part number of each point), runs don't cross parts.
+    """
+    changes = np.diff(x) != 0
+    if parts is not None:
+        changes |= np.diff(parts) != 0
+    starts = np.flatnonzero(changes) + 1
+    starts = np.concatenate(([0], starts))
+    counts = np.diff(np.concatenate((starts, [len(x)])))
+    run = np.repeat(np.arange(len(starts)), counts)
+
+    def first_per_run(candidates):
+        candidate_run = run[candidates]
+        return candidates[
+            np.concatenate(([True], candidate_run[1:] != candidate_run[:-1]))
+        ]
+
+    argmin = first_per_run(np.flatnonzero(y == np.minimum.reduceat(y, starts)[run]))
+    argmax = first_per_run(np.flatnonzero(y == np.maximum.reduceat(y, starts)[run]))
+    return np.unique(np.concatenate((starts, starts + counts - 1, argmin, argmax)))
+
+
+def _histogram(
+    values: np.ndarray,
+    bins,
+    range_: Tuple[float, float],
+    density: bool,
+    cumulative: bool,
+    max_bins: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the counts and bin edges of `values` within `range_`.
+    If `bins` is a string, it is passed to `np.histogram`, but no more than `max_bins` bins are used.
+    With `density`, the counts are all zeros when no values are within `range_`, like without `density`.
+    """
+    counts, edges = np.histogram(values, bins=bins, range=range_)
+    if isinstance(bins, str) and len(edges) - 1 > max_bins:
+        counts, edges = np.histogram(values, bins=max_bins, range=range_)
+    if density and counts.any():
+        counts = counts / (counts.sum() * np.diff(edges))
+    if cumulative:
+        counts = np.cumsum(counts * np.diff(edges) if density else counts)
+    return counts, edges
+
+
+def _column_fill(cols: np.ndarray, start: np.ndarray, end: np.ndarray) -> tuple:
+    """Returns the (rows, cols) indices of the cells from row `start` up to and including row `end` in each of `cols`."""
+    lengths = end - start + 1
+    offsets = np.arange(lengths.sum()) - np.repeat(
+        np.cumsum(lengths) - lengths, lengths
+    )
+    return np.repeat(start, lengths) + offsets, np.repeat(cols, lengths)
+
+
 def _round_away_from_zero(value: float) -> int:
     return math.ceil(value) if value >= 0 else math.floor(value)
 
@@ -58,6 +168,10 @@ def _round_half_away_from_zero(num: float) -> int:
     return ((num > 0) - (num < 0)) * int(abs(num) + 0.5)
 
 
+def _round_half_away_from_zero_array(num: np.ndarray) -> np.ndarray:
+    return (np.sign(num) * np.floor(np.abs(num) + 0.5)).astype(np.int64)
+
+
 def _best_ticks(min_: float, max_: float, most: int) -> list:
     """Returns a list of suitable tick values."""
     most = max(most, 1)
@@ -82,102 +196,136 @@ def _best_ticks(min_: float, max_: float, most: int) -> list:
     ]
 
 
+def _isotonic_regression(
+    values: List[float], lower: List[float], upper: List[float]
+) -> List[float]:
+    """
+    Returns the non-decreasing sequence closest to `values` (least squares) that lies within the `lower` and `upper` bounds,
+    using the pool adjacent violators algorithm. The bounds must be non-decreasing themselves, with `lower` <= `upper`.
+    """
+    blocks = []  # [sum, size, lower bound, upper bound] of pooled values
+
+    def fitted(block):
+        total, size, low, high = block
+        return min(max(total / size, low), high)
+
+    for value, low, high in zip(values, lower, upper):
+        blocks.append([value, 1, low, high])
+        while len(blocks) > 1 and fitted(blocks[-2]) > fitted(blocks[-1]):
+            total, size, low, high = blocks.pop()
+            block = blocks[-1]
+            blocks[-1] = [block[0] + total, block[1] + size, low, block[3]]
+    return [fitted(block) for block in blocks for _ in range(block[1])]
+
+
+def _xticklabel_bounds(
+    tick_positions: List[int], lengths: List[int], width: int, margin: int
+) -> Optional[Tuple[List[int], List[int], List[int]]]:
+    """
+    Returns the offset of each label (total length plus margins of the labels before it), and the lowest and highest
+    offset start position of each label such that it covers its tick and stays within the figure.
+    The bounds are tightened to be non-decreasing. Returns `None` if the labels can't be placed that way.
+    """
+    offsets = []
+    offset = 0
+    for length in lengths:
+        offsets.append(offset)
+        offset += length + margin
+    lower = [
+        tick_pos - length + 1 - offset
+        for tick_pos, length, offset in zip(tick_positions, lengths, offsets)
+    ]
+    upper = [tick_pos - offset for tick_pos, offset in zip(tick_positions, offsets)]
+    # the first label must start within the figure, the last must end within it
+    lower[0] = max(lower[0], 0)
+    upper[-1] = min(upper[-1], width - lengths[-1] - offsets[-1])
+    for i in range(1, len(lower)):
+        lower[i] = max(lower[i], lower[i - 1])
+    for i in reversed(range(len(upper) - 1)):
+        upper[i] = min(upper[i], upper[i + 1])
+    if any(low > high for low, high in zip(lower, upper)):
+        return None
+    return offsets, lower, upper
+
+
+def _place_xticklabels(
+    tick_positions: List[int],
+    lengths: List[int],
+    bounds: Tuple[List[int], List[int], List[int]],
+) -> List[List[int]]:
+    """Places labels of `lengths` as close as possible to being centered below their ticks, within `bounds`."""
+    offsets, lower, upper = bounds
+    targets = [
+        tick_pos - length // 2 - offset
+        for tick_pos, length, offset in zip(tick_positions, lengths, offsets)
+    ]
+    anchors = []
+    # rounding keeps the fitted positions non-decreasing and within their (integer) bounds
+    for fitted, offset, length in zip(
+        _isotonic_regression(targets, lower, upper), offsets, lengths
+    ):
+        left = round(fitted) + offset
+        anchors.append([left, left + length])
+    return anchors
+
+
 def _optimize_xticklabel_anchors(
     tick_positions: List[int],
     labels: List[str],
     width: int,
     margin: int = 2,
-    stepsize: float = 0.1,
-    tolerance: float = 0.3,
-    max_iterations: int = 1000,
+    thin: bool = False,
 ) -> List[List[int]]:
     """
-    Models the placement of tick labels as a 1-dimensional case of a force-directed graph.
-    Spring forces between the labels are simulated iteratively until they stabilize.
+    Places tick labels as close as possible to being centered below their ticks (least squares),
+    such that each label covers its tick, labels keep `margin` in between, and all labels are within the figure.
+
+    With each label's position offset by the total length (plus margins) of the labels before it,
+    non-overlapping labels are exactly those with non-decreasing offset positions, and covering the tick
+    and staying within the figure become bounds on each offset position.
+    So the optimal placement is found in linear time with bounded isotonic regression.
+
+    If the labels can't be placed like that, the margin is reduced to a single space, then the longest labels are shortened,
+    and as a last resort (for ticks right next to each other) the margin is dropped.
 
     Args:
         tick_positions: Ordered positions of the ticks.
         labels: Tick labels.
         width: Width of plot.
         margin: Margin between labels.
-        stepsize: Spring force simulation step size.
-        tolerance: Tolerance for termination.
-        max_iterations: Maximum number of iterations.
+        thin: Set to `True` to leave out labels (keeping every other one, every third one, and so on) rather than
+              shortening them, e.g. for numbers. Left out labels get an empty [start, end] range at their tick.
     Returns:
         List of [start, end] positions of labels.
     """
-    anchors = []
-    for tick_pos, label in zip(tick_positions, labels):
-        left = tick_pos - len(label) // 2
-        right = left + len(label)
-        # if anchor is out of bounds, move it inside bounds
-        d = right - width
-        if d > 0:
-            left -= d
-            right -= d
-        anchors.append([left, right])
-
-    def calc_forces(anchors):
-        forces = [0] * len(anchors)
-        # forces between labels
-        for i in range(len(anchors) - 1):
-            f = max(0, anchors[i][1] + margin - anchors[i + 1][0])
-            forces[i] -= f
-            forces[i + 1] += f
-        # figure boundary forces
-        forces[0] -= min(0, anchors[0][0])
-        forces[-1] -= max(0, anchors[-1][1] - width)
-        return forces
-
-    prev_total_forces = float("inf")
-    forces = calc_forces(anchors)
-    total_forces = sum([abs(f) for f in forces])
-
-    if total_forces == 0:
-        return anchors  # early return
-
-    iterations = 0
-    while abs(total_forces - prev_total_forces) > tolerance:
-        for anchor, force, tick_pos in zip(anchors, forces, tick_positions):
-            anchor[0] += force * stepsize
-            anchor[1] += force * stepsize
-            # don't move beyond tick position
-            if round(anchor[0]) > tick_pos:
-                d = round(anchor[0]) - tick_pos
-                anchor[0] -= d
-                anchor[1] -= d
-            elif round(anchor[1]) - 1 < tick_pos:
-                d = tick_pos - round(anchor[1]) + 1
-                anchor[0] += d
-                anchor[1] += d
-
-        # recalculate forces
-        prev_total_forces = sum([abs(f) for f in forces])
-        forces = calc_forces(anchors)
-        total_forces = sum([abs(f) for f in forces])
-
-        iterations += 1
-        # if iterations == 3:
-        #     break
-        if iterations >= max_iterations:
-            warn(
-                f"Max iterations (={max_iterations}) during X axis label placement reached."
-            )
-            break
-
-    # round anchors
-    anchors = [
-        [round(anchor[0]), round(anchor[0]) + len(label)]
-        for anchor, label in zip(anchors, labels)
-    ]
-    # limit to figure boundaries
-    for anchor in anchors:
-        anchor[0] = max(0, anchor[0])
-        anchor[1] = min(width, anchor[1])
-    # don't overwrite other labels
-    for i in range(len(anchors)):
-        if i > 0:
-            anchors[i][0] = max(tick_positions[i - 1] + 1, anchors[i][0])
-        if i < len(anchors) - 1:
-            anchors[i][1] = min(tick_positions[i + 1], anchors[i][1])
-    return anchors
+    lengths = [len(label) for label in labels]
+    if thin:
+        for step in range(1, len(labels) + 1):
+            kept = list(range(0, len(labels), step))
+            ticks = [tick_positions[i] for i in kept]
+            kept_lengths = [lengths[i] for i in kept]
+            bounds = _xticklabel_bounds(ticks, kept_lengths, width, margin)
+            if bounds is not None:
+                anchors = [[tick_pos, tick_pos] for tick_pos in tick_positions]
+                placed = _place_xticklabels(ticks, kept_lengths, bounds)
+                for i, anchor in zip(kept, placed):
+                    anchors[i] = anchor
+                return anchors
+
+    # if the labels don't all fit, use a margin of a single space
+    if sum(lengths) + margin * (len(labels) - 1) > width:
+        margin = min(margin, 1)
+    for margin in [margin] + [m for m in (1, 0) if m < margin]:
+        # a label can't extend past the space left by its neighbours covering their ticks
+        edges = [-1 - margin] + tick_positions + [width + margin]
+        room = [right - left - 1 - 2 * margin for left, right in zip(edges, edges[2:])]
+        for longest in range(max(lengths), 0, -1):
+            shortened = [
+                max(1, min(length, space, longest))
+                for length, space in zip(lengths, room)
+            ]
+            bounds = _xticklabel_bounds(tick_positions, shortened, width, margin)
+            if bounds is not None:
+                return _place_xticklabels(tick_positions, shortened, bounds)
+    # ticks right next to each other: labels can only be placed at their ticks
+    return [[tick_pos, tick_pos + 1] for tick_pos in tick_positions]